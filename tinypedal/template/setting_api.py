@@ -29,6 +29,7 @@ API_DEFAULT = {
         "active_state": True,
         "enable_player_index_override": False,
         "player_index": -1,
+        "broadcast_list_update_interval": 1000,
         "character_encoding": "UTF-8",
         "enable_restapi_access": True,
         "restapi_update_interval": 200,
@@ -50,6 +51,7 @@ API_DEFAULT = {
         "active_state": True,
         "enable_player_index_override": False,
         "player_index": -1,
+        "broadcast_list_update_interval": 1000,
         "character_encoding": "UTF-8",
         "enable_restapi_access": True,
         "restapi_update_interval": 200,
@@ -21,31 +21,35 @@ Broadcast list view
 """
 
 import logging
-from time import monotonic
-
-from PySide2.QtCore import Qt, Slot, QTimer
-from PySide2.QtGui import QColor, QFont, QPalette
+import threading
+from functools import lru_cache
+from math import remainder
+from operator import is_
+from time import monotonic, monotonic_ns, sleep
+from typing import NamedTuple
+
+from PySide2.QtCore import Qt, Signal, Slot, QObject, QAbstractTableModel, QModelIndex
+from PySide2.QtGui import QBrush, QColor, QFont, QFontMetrics, QPalette
 from PySide2.QtWidgets import (
     QGridLayout,
     QGroupBox,
     QHBoxLayout,
     QLabel,
     QVBoxLayout,
-    QTableWidget,
-    QTableWidgetItem,
-    QProgressBar,
+    QTableView,
     QPushButton,
     QVBoxLayout,
     QWidget,
     QHeaderView,
     QSizePolicy,
     QAbstractItemView,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
 )
 
 from .. import app_signal
 from ..api_control import api
-from ..calculation import sec2laptime
-from ..const_common import MAX_SECONDS
+from ..const_common import MAX_SECONDS, MAX_VEHICLES
 from ..module_info import minfo
 from ..setting import cfg
 from ._common import UIScaler
@@ -59,8 +63,10 @@ SORT_LABELS = ("Standings", "Relative")
 BATTLE_THRESHOLD = 0.7  # seconds
 CLOSE_THRESHOLD = 1.5  # seconds
 LAPPING_THRESHOLD = 3.0  # seconds proximity to blue-flagged car
+PROXIMITY_GAP_TOLERANCE = 0.05  # seconds relative drift before proximity is re-analyzed
 YELLOW_SPEED_THRESHOLD = 8  # m/s
 YELLOW_STICKY_DURATION = 3.5  # seconds to keep yellow highlight after clearing
+YELLOW_STICKY_DURATION_NS = int(YELLOW_STICKY_DURATION * 1e9)
 COLOR_BATTLE = QColor(34, 139, 34)  # green
 COLOR_CLOSE = QColor(255, 140, 0)  # orange
 COLOR_YELLOW = QColor(255, 255, 0)  # yellow
@@ -68,10 +74,451 @@ COLOR_BLUE = QColor(0, 160, 255)  # blue
 COLOR_PENALTY = QColor(220, 30, 30)  # red
 COLOR_PIT = QColor(150, 150, 150)  # grey
 COLOR_HIGHLIGHT = QColor(142, 68, 173)  # purple for per-class highlights
+COLOR_HEADER_TEXT = QColor(255, 255, 255)  # class header row text
+COLOR_HEADER_BG = QColor(43, 43, 43)  # class header row background
+COLUMN_NAME = 2  # driver name column, also holds driver name as user data
+ROLE_CELL = Qt.UserRole + 1  # all display roles of a cell in one data() call
 VE_STR_WIDTH = 16
 STATUS_GAP = 6
 USER_SELECTION_COOLDOWN = 2.0  # seconds to avoid clobbering user selection after interaction
 POS_STICKY_DURATION = 5.0  # seconds to keep the position-change arrow visible
+NAME_WIDTH_CHARS = 24  # characters to fit in fixed width name column
+SNAPSHOT_INTERVAL = 200  # ms between driver snapshot reads, top speed and list change checks
+# Integrity cell text by percentage, formatted once
+_PERCENT_TEXT = tuple(f"{percent}%" for percent in range(101))
+# Virtual energy text by percentage, right aligned to 3 digits
+_VE_PERCENT_TEXT = tuple(f"{percent:3d}%" for percent in range(101))
+
+
+class DriverReading(NamedTuple):
+    """Driver info read from API, immutable and safe to pass between threads"""
+
+    place: int
+    class_name: str
+    name: str
+    in_pits: bool
+    speed: float
+    is_blue: bool
+    slot_id: int
+    best_laptime: float
+    last_laptime: float
+    time_into: float
+
+
+class DriverSnapshot(NamedTuple):
+    """Driver readings of all vehicles, ordered by driver index"""
+
+    laptime_est: float
+    drivers: tuple
+
+
+def read_driver_snapshot() -> DriverSnapshot:
+    """Read driver snapshot from API, can be called from worker thread"""
+    read_vehicle = api.read.vehicle
+    read_timing = api.read.timing
+    blue_flag = api.read.session.blue_flag
+    return DriverSnapshot(
+        read_timing.estimated_laptime(),
+        tuple(
+            DriverReading(
+                read_vehicle.place(index),
+                read_vehicle.class_name(index),
+                read_vehicle.driver_name(index),
+                read_vehicle.in_pits(index) or read_vehicle.in_garage(index),
+                read_vehicle.speed(index),
+                blue_flag(index),
+                read_vehicle.slot_id(index),
+                read_timing.best_laptime(index),
+                read_timing.last_laptime(index),
+                read_timing.estimated_time_into(index),
+            )
+            for index in range(read_vehicle.total_vehicles())
+        ),
+    )
+
+
+class DriverSnapshotProducer(QObject):
+    """Driver snapshot producer
+
+    Read driver snapshot in a worker thread every SNAPSHOT_INTERVAL,
+    and hand off to UI thread via a single latest snapshot slot.
+    Snapshots not taken before next read are replaced, so pending
+    updates never pile up if UI thread is busy.
+    """
+
+    updated = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._stopped = True
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._latest = None
+
+    def take(self) -> DriverSnapshot | None:
+        """Take latest snapshot, None if already taken"""
+        with self._lock:
+            snapshot = self._latest
+            self._latest = None
+        return snapshot
+
+    def enable(self):
+        """Enable producer"""
+        if self._stopped:
+            self._stopped = False
+            self._event.clear()
+            threading.Thread(target=self.__updating, daemon=True).start()
+
+    def disable(self):
+        """Disable producer"""
+        self._event.set()
+        while not self._stopped:
+            sleep(0.01)
+
+    def __updating(self):
+        """Read and emit driver snapshot"""
+        _event_wait = self._event.wait
+        interval = SNAPSHOT_INTERVAL / 1000
+        try:
+            while not _event_wait(interval):
+                try:
+                    snapshot = read_driver_snapshot()
+                except (AttributeError, IndexError):
+                    continue
+                except Exception:  # keep producer alive on unexpected read error
+                    logger.exception("Broadcast: failed reading driver snapshot")
+                    continue
+                with self._lock:
+                    pending = self._latest is not None
+                    self._latest = snapshot
+                # Only notify once until taken, UI thread reads latest on arrival
+                if not pending:
+                    self.updated.emit()
+        finally:
+            # Always mark stopped, so enable() can restart and disable() won't block
+            self._stopped = True
+
+
+def _overall_place(driver) -> int:
+    """Sort key, overall place of DriverInfo"""
+    return driver.place
+
+
+def _class_leader_place(class_group) -> int:
+    """Sort key, overall place of class leader in (class_name, drivers)"""
+    return class_group[1][0].place
+
+
+class DriverInfo(NamedTuple):
+    """Driver info snapshot, read once per list refresh"""
+
+    place: int
+    class_name: str
+    name: str
+    index: int
+    rel_gap: float
+    in_pits: bool
+    is_yellow: bool
+    is_blue: bool
+    slot_id: int
+    best_laptime: float
+    last_laptime: float
+    class_id: int
+
+
+class TableRow(NamedTuple):
+    """Driver table row, preformatted text and foreground color per column
+
+    Color None uses default text color. Class header rows span all columns.
+    """
+
+    texts: tuple
+    colors: tuple
+    name: str = ""
+    bold_pos: bool = False
+    is_header: bool = False
+
+
+class DriverTableModel(QAbstractTableModel):
+    """Driver table model
+
+    Rows are replaced as a whole on each refresh, views are only notified
+    of the range of rows that actually changed.
+    """
+
+    def __init__(self, headers: tuple, parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        self._rows = []
+        self._align_center = int(Qt.AlignCenter)
+        self._align_name = int(Qt.AlignVCenter | Qt.AlignLeft)
+        self.bold_font = QFont()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Row count"""
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        """Column count"""
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        """Column header labels"""
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return None
+
+    def flags(self, index):
+        """Driver rows selectable but not editable, header rows disabled"""
+        if self._rows[index.row()].is_header:
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Cell data"""
+        row = self._rows[index.row()]
+        column = index.column()
+        if role == ROLE_CELL:
+            if row.is_header:
+                return (row.texts[column], row.colors[column], self.bold_font,
+                        self._align_center, COLOR_HEADER_BG)
+            return (
+                row.texts[column],
+                row.colors[column],
+                self.bold_font if column == 0 and row.bold_pos else None,
+                self._align_name if column == COLUMN_NAME else self._align_center,
+                None,
+            )
+        if role == Qt.DisplayRole:
+            return row.texts[column]
+        if role == Qt.ForegroundRole:
+            return row.colors[column]
+        if role == Qt.TextAlignmentRole:
+            if column == COLUMN_NAME and not row.is_header:
+                return self._align_name
+            return self._align_center
+        if role == Qt.FontRole:
+            if row.is_header or (column == 0 and row.bold_pos):
+                return self.bold_font
+            return None
+        if role == Qt.BackgroundRole:
+            return COLOR_HEADER_BG if row.is_header else None
+        if role == Qt.UserRole:
+            return row.name
+        return None
+
+    def driver_name(self, row: int) -> str:
+        """Driver name at row, empty if header row or out of range"""
+        if 0 <= row < len(self._rows):
+            return self._rows[row].name
+        return ""
+
+    def find_driver(self, driver_name: str) -> int:
+        """Row of driver name, -1 if not found"""
+        for row, data in enumerate(self._rows):
+            if data.name == driver_name and not data.is_header:
+                return row
+        return -1
+
+    def set_rows(self, rows: list, reset: bool):
+        """Set all rows
+
+        Args:
+            rows: list of TableRow.
+            reset: reset model if row layout changed, otherwise only emit
+                data changed for the first to last changed row.
+        """
+        if reset:
+            self.beginResetModel()
+            self._rows = rows
+            self.endResetModel()
+            return
+        old_rows = self._rows
+        self._rows = rows
+        # Colors are shared constants (or None), compare by identity
+        changed = [
+            row for row, (data, old) in enumerate(zip(rows, old_rows))
+            if data.texts != old.texts
+            or data.bold_pos != old.bold_pos
+            or not all(map(is_, data.colors, old.colors))
+        ]
+        if changed:
+            self.dataChanged.emit(
+                self.index(changed[0], 0),
+                self.index(changed[-1], len(self._headers) - 1),
+            )
+
+    def clear(self):
+        """Remove all rows"""
+        self.beginResetModel()
+        self._rows = []
+        self.endResetModel()
+
+
+class DriverTableDelegate(QStyledItemDelegate):
+    """Driver table delegate
+
+    Read text, color, font, alignment and background of a cell from model
+    in a single ROLE_CELL call, instead of one data() call per role.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._font_metrics = {}
+        self._palettes = {}
+
+    def initStyleOption(self, option, index):
+        """Init style option from cell data"""
+        text, color, font, alignment, background = index.data(ROLE_CELL)
+        option.index = index
+        option.text = text
+        option.features |= QStyleOptionViewItem.HasDisplay
+        option.displayAlignment = alignment
+        if font is not None:
+            option.font = font
+            metrics = self._font_metrics.get(id(font))
+            if metrics is None:
+                metrics = self._font_metrics[id(font)] = QFontMetrics(font)
+            option.fontMetrics = metrics
+        if color is not None:
+            # Colors are shared constants, reuse one palette per color and base palette
+            key = (id(color), option.palette.cacheKey())
+            palette = self._palettes.get(key)
+            if palette is None:
+                palette = self._palettes[key] = QPalette(option.palette)
+                palette.setBrush(QPalette.Text, color)
+            option.palette = palette
+        if background is not None:
+            option.backgroundBrush = QBrush(background)
+
+
+class ProximityInfo(NamedTuple):
+    """Proximity info, bitmasks of driver indices (bit n set for driver index n)"""
+
+    battles: int
+    close: int
+    lapping: int
+
+
+@lru_cache(maxsize=4096)
+def _format_laptime_ms(milliseconds: int) -> str:
+    """Lap time (min:sec.ms) from integer milliseconds, cached
+
+    Best/last lap values rarely change between refreshes,
+    so most calls are served from cache.
+    """
+    if milliseconds > 60000:
+        minutes, rest_ms = divmod(milliseconds, 60000)
+        return f"{minutes}:{rest_ms / 1000:06.3f}"
+    return f"{milliseconds / 1000:.3f}"
+
+
+@lru_cache(maxsize=1024)
+def _format_percent_tenths(per_mille: int) -> str:
+    """Percentage with one decimal from integer per mille, cached"""
+    return f"{per_mille / 10:.1f}%"
+
+
+def _format_time(seconds: float) -> str:
+    """Format time value for display"""
+    if seconds <= 0 or seconds >= MAX_SECONDS:
+        return "-:--.---"
+    return _format_laptime_ms(round(seconds * 1000))
+
+
+def _format_ve(driver_index: int) -> str:
+    """Format virtual energy remaining for driver list"""
+    pct_f = _read_ve_fraction(driver_index)
+    # Hide the bar for vehicles that don't support VE or return 0
+    if pct_f is None or pct_f <= 0.0:
+        return ""
+    # Show only percentage value (no bar) in the driver list,
+    # fraction is already clamped to 0..1
+    return _VE_PERCENT_TEXT[int(pct_f * 100)]
+
+
+def _read_ve_fraction(driver_index: int) -> float | None:
+    """Read virtual energy and return fraction 0..1 or None if unavailable"""
+    # Try legacy minfo dataset first (fraction 0..1)
+    # Dataset is a fixed-size tuple of slotted VehicleDataSet,
+    # so a bounds check replaces exception handling here.
+    data_set = minfo.vehicles.dataSet
+    if 0 <= driver_index < len(data_set):
+        veh = data_set[driver_index]
+        if veh.driverName:
+            ve_legacy = veh.energyRemaining
+            if ve_legacy > -1.0:
+                return max(0.0, min(1.0, ve_legacy))
+
+    # Reader API: read both ve and max_e and infer units,
+    # readers return float, only missing reader or index can fail
+    try:
+        read_vehicle = api.read.vehicle
+        ve = read_vehicle.virtual_energy(driver_index)
+        max_e = read_vehicle.max_virtual_energy(driver_index)
+    except (AttributeError, IndexError):
+        return None
+    if ve is None:
+        return None
+    # If max_e present and non-zero, treat ve as absolute and compute fraction
+    if max_e:
+        return max(0.0, min(1.0, ve / max_e))
+    # If ve present but no max_e, infer whether ve is percent (0-100) or fraction
+    if ve > 1.0:
+        return max(0.0, min(1.0, ve / 100.0))
+    return max(0.0, min(1.0, ve))
+
+
+def _read_penalty(driver_index: int) -> tuple[int, int]:
+    """Read (penalties, count lap flag) for driver, (0, -1) if unavailable"""
+    try:
+        penalties = api.read.vehicle.number_penalties(driver_index)
+    except (AttributeError, IndexError):
+        return 0, -1
+    if penalties <= 0:
+        return penalties, -1
+    # Scoring struct only fetched when penalties are pending
+    try:
+        count_lap_flag = api.shmm.lmuScorVeh(driver_index).mCountLapFlag
+    except (AttributeError, IndexError):
+        count_lap_flag = -1
+    return penalties, count_lap_flag
+
+
+def _format_penalty(penalties: int, count_lap_flag: int) -> tuple[str, str]:
+    """Format penalty (tag, reason) from penalty count and count lap flag
+
+    Note: mCountLapFlag indicates lap counting behavior during penalty,
+    not necessarily the penalty type. This is a best-effort detection.
+    0 = stop & go (don't count lap or time)
+    1 = drive through (count lap but not time)
+    2 = normal (count lap and time - no penalty)
+    """
+    if count_lap_flag == 0:
+        return f"SG({penalties})", f"Stop & Go ({penalties} pending)"
+    if count_lap_flag == 1:
+        return f"DT({penalties})", f"Drive Through ({penalties} pending)"
+    # Fallback - just show penalty count
+    return f"PEN({penalties})", f"Penalty ({penalties} pending)"
+
+
+def _near_pairs(time_into: dict, indices: list, laptime_est: float, threshold: float):
+    """Yield (index a, index b, gap) of driver pairs within threshold seconds
+
+    Drivers are sorted by time into lap, then swept forward over a copy
+    shifted by one lap, so pairs across start/finish line are included.
+    """
+    pairs = sorted((time_into[idx] % laptime_est, idx) for idx in indices)
+    total = len(pairs)
+    pairs += [(seconds + laptime_est, idx) for seconds, idx in pairs]
+    for i in range(total):
+        seconds_a, idx_a = pairs[i]
+        for j in range(i + 1, i + total):
+            seconds_b, idx_b = pairs[j]
+            diff = seconds_b - seconds_a
+            if diff > threshold:
+                break
+            yield idx_a, idx_b, min(diff, laptime_est - diff)
 
 
 class BroadcastList(QWidget):
@@ -81,7 +528,10 @@ class BroadcastList(QWidget):
         super().__init__(parent)
         self.last_enabled = None
         self._sort_mode = SORT_STANDINGS
-        self._yellow_timestamps = {}  # driver_index -> last time yellow was active
+        # Last time (ns) yellow was active, indexed by driver_index
+        self._yellow_timestamps_ns = [-YELLOW_STICKY_DURATION_NS] * MAX_VEHICLES
+        # Stable integer id per class name, drivers are grouped by id
+        self._class_ids = {}
         # map vehicle slot_id -> max speed in m/s to remain stable across class/order changes
         self._top_speeds = {}  # slot_id -> max speed in m/s
         # Track last seen best lap value and the lap number when it was set
@@ -89,27 +539,34 @@ class BroadcastList(QWidget):
         self._best_lap_number = {}  # driver_index -> lap_number
         # Timestamp of last explicit user selection (click/double-click)
         self._last_user_action = 0.0
-        # Counter used by the timing updater to trigger periodic list refreshes
-        self._list_update_counter = 0
+        # Last seen (place, in pits) per driver and checks since last list refresh
+        self._list_signature = None
+        self._list_stale_ticks = 0
+        # Last analyzed (driver states, time into lap, proximity info)
+        self._proximity_cache = (None, None, None)
         # Track last known overall place per driver to show gained/lost position
         self._last_places = {}  # driver_index -> last_place
         # Track recent position change timestamps and direction so arrow can be sticky
         # maps driver_index -> (timestamp, 'up'|'down')
         self._pos_change_info = {}
+        # Penalty (count, count lap flag) per driver index, cleared every table fill
+        self._penalty_cache = {}
+        # Row layout (class, driver indices) of last table fill, rows reused while unchanged
+        self._table_layout = None
 
         # Label
         self.label_spectating = QLabel("")
 
         # Table for drivers
-        self.listbox_spectate = QTableWidget(self)
+        self.listbox_spectate = QTableView(self)
         self.listbox_spectate.setAlternatingRowColors(True)
         driver_font = QFont("Consolas", 10)
         self.listbox_spectate.setFont(driver_font)
         # Use stylesheet to add stronger column separators and keep selection styling
         self.listbox_spectate.setStyleSheet(
-            "QTableWidget { border: 1px solid #555; border-radius: 3px; }"
-            "QTableWidget::item { padding: 2px 4px; border-right: 1px solid #444; }"
-            "QTableWidget::item:selected { background: #2980b9; color: white; }"
+            "QTableView { border: 1px solid #555; border-radius: 3px; }"
+            "QTableView::item { padding: 2px 4px; border-right: 1px solid #444; }"
+            "QTableView::item:selected { background: #2980b9; color: white; }"
             "QHeaderView::section { background: #2f2f2f; color: #f0f0f0; border-right: 2px solid #555; }"
         )
         # show grid and use solid lines for clearer separators
@@ -131,13 +588,19 @@ class BroadcastList(QWidget):
             "Pos Change",
             "Vehicle Integrity",
         ]
-        self.listbox_spectate.setColumnCount(len(headers))
-        self.listbox_spectate.setHorizontalHeaderLabels(headers)
+        self._table_model = DriverTableModel(tuple(headers), self)
+        # Bold and larger font for class headers and position change arrows
+        self._table_model.bold_font = QFont(driver_font)
+        self._table_model.bold_font.setBold(True)
+        self._table_model.bold_font.setPointSize(driver_font.pointSize() + 2)
+        self.listbox_spectate.setModel(self._table_model)
+        self.listbox_spectate.setItemDelegate(DriverTableDelegate(self.listbox_spectate))
         # Auto-scale columns to fill available space
         header = self.listbox_spectate.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Stretch)
-        # Make the Name column auto-size to its contents and give it a reasonable
-        # minimum width so names aren't cut off when the window is resized.
+        # Fixed widths are precomputed from font metrics, so cell changes never
+        # trigger content measuring; stretched columns only share remaining width.
+        font_metrics = QFontMetrics(driver_font)
         try:
             # Position column: fixed narrow but wide enough to show arrow
             header.setSectionResizeMode(0, QHeaderView.Fixed)
@@ -145,30 +608,24 @@ class BroadcastList(QWidget):
             # Delta column: fixed narrow
             header.setSectionResizeMode(1, QHeaderView.Fixed)
             self.listbox_spectate.setColumnWidth(1, UIScaler.pixel(64))
-            # Name column: autosize to contents, keep minimum width
-            header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
+            # Name column: fixed width fits NAME_WIDTH_CHARS, keep minimum width
+            header.setSectionResizeMode(2, QHeaderView.Fixed)
             min_name_w = UIScaler.pixel(160)
-            self.listbox_spectate.setColumnWidth(2, min_name_w)
+            name_w = font_metrics.averageCharWidth() * NAME_WIDTH_CHARS + UIScaler.pixel(8)
+            self.listbox_spectate.setColumnWidth(2, max(min_name_w, name_w))
             # keep other columns stretched to use remaining space
-            for col in range(3, self.listbox_spectate.columnCount()):
+            for col in range(3, len(headers)):
                 header.setSectionResizeMode(col, QHeaderView.Stretch)
         except Exception:
-            # Fall back to a global stretch mode if ResizeToContents isn't supported
+            # Fall back to a global stretch mode if per-section modes aren't supported
             header.setSectionResizeMode(QHeaderView.Stretch)
         # Allow the table to expand to fill available layout space
         self.listbox_spectate.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        # Timer to track live top speeds for all vehicles
-        self._speed_timer = QTimer(self)
-        self._speed_timer.timeout.connect(self._update_speeds)
-        # default to 200ms polling for speed updates
-        self._speed_timer.setInterval(200)
-
-        # Timer to update the vehicle status / timing panel more frequently.
-        # Use 100ms interval so timing-based counters keep expected behaviour
-        # (10 ticks ~= 1s for list auto-refresh).
-        self._timing_timer = QTimer(self)
-        self._timing_timer.timeout.connect(self._update_timing)
-        self._timing_timer.setInterval(100)  # 100 ms -> ~10 Hz updates
+        # Driver snapshot read off UI thread, drives top speed tracking and list refresh,
+        # list refreshed only when order or status changed
+        self._driver_snapshot = None
+        self._snapshot_producer = DriverSnapshotProducer(self)
+        self._snapshot_producer.updated.connect(self._on_snapshot, Qt.QueuedConnection)
         # make table read-only and ensure double-click always triggers spectate
         self.listbox_spectate.setEditTriggers(QAbstractItemView.NoEditTriggers)
         # Use item selection so only individual cells (name column) can be highlighted
@@ -177,17 +634,21 @@ class BroadcastList(QWidget):
             self.listbox_spectate.setSelectionMode(QAbstractItemView.SingleSelection)
         except Exception:
             pass
-        self.listbox_spectate.cellDoubleClicked.connect(lambda r, c: self._on_row_double_clicked(r, c))
+        self.listbox_spectate.doubleClicked.connect(
+            lambda index: self._on_row_double_clicked(index.row(), index.column()))
         # track user's clicks so auto-refresh won't override selection immediately after interaction
         try:
-            self.listbox_spectate.cellClicked.connect(lambda r, c: setattr(self, '_last_user_action', monotonic()))
+            self.listbox_spectate.clicked.connect(
+                lambda index: setattr(self, '_last_user_action', monotonic()))
         except Exception:
             pass
         # hide the vertical row headers (remove visible row lines on the left)
         try:
             self.listbox_spectate.verticalHeader().setVisible(False)
-            # make rows stretch to fill vertical space
-            self.listbox_spectate.verticalHeader().setSectionResizeMode(QHeaderView.Stretch)
+            # fixed row height from font metrics, avoid relayout of all rows on each change
+            self.listbox_spectate.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+            self.listbox_spectate.verticalHeader().setDefaultSectionSize(
+                font_metrics.height() + UIScaler.pixel(8))
         except Exception:
             pass
 
@@ -246,10 +707,7 @@ class BroadcastList(QWidget):
             self.update_drivers("Anonymous", cfg.api["player_index"], False)
         else:
             # clear rows only, keep headers
-            try:
-                self.listbox_spectate.setRowCount(0)
-            except Exception:
-                self.listbox_spectate.clear()
+            self._table_model.clear()
             self.label_spectating.setText("Spectating: <b>Disabled</b>")
 
         # Update button state only if changed
@@ -270,37 +728,27 @@ class BroadcastList(QWidget):
         self.label_spectating.setDisabled(not enabled)
         if enabled:
             logger.info("ENABLED: broadcast mode")
-            # trigger an immediate refresh of the driver list
-            self._list_update_counter = 9
-            # start live speed tracking
-            try:
-                self._speed_timer.start()
-            except Exception:
-                pass
-            # start timing/vehicle-status updates (more frequent)
-            try:
-                self._timing_timer.start()
-            except Exception:
-                pass
+            # trigger a refresh of the driver list on next check
+            self._list_signature = None
+            self._snapshot_producer.enable()
             self.refresh()
         else:
             logger.info("DISABLED: broadcast mode")
             # when disabled just clear the list
-            try:
-                self.listbox_spectate.setRowCount(0)
-            except Exception:
-                self.listbox_spectate.clear()
+            self._table_model.clear()
+            self._penalty_cache.clear()
             # stop live speed tracking and clear cache
-            try:
-                self._speed_timer.stop()
-            except Exception:
-                pass
-            # stop timing updates
-            try:
-                self._timing_timer.stop()
-            except Exception:
-                pass
+            self._snapshot_producer.disable()
             self._top_speeds.clear()
+            _format_laptime_ms.cache_clear()
+            _format_percent_tenths.cache_clear()
+
+    def showEvent(self, event):
+        """Resume list updates when shown"""
+        super().showEvent(event)
+        if cfg.api["enable_player_index_override"]:
+            self._list_signature = None
+            self._snapshot_producer.enable()
 
     def toggle_spectate(self, checked: bool):
         """Toggle spectate mode"""
@@ -338,10 +786,9 @@ class BroadcastList(QWidget):
         """Handle double click anywhere on a row: select driver and focus camera."""
         try:
             # Name column is at index 2 (pos=0, delta=1)
-            it = self.listbox_spectate.item(row, 2)
-            if it is None:
+            driver_name = self._table_model.driver_name(row)
+            if not driver_name:
                 return
-            driver_name = it.data(Qt.UserRole) or it.text()
             # mark user action to prevent auto-refresh clobbering
             try:
                 self._last_user_action = monotonic()
@@ -356,31 +803,15 @@ class BroadcastList(QWidget):
     def update_drivers(self, selected_driver_name: str, selected_index: int, match_name: bool, force_save: bool = False):
         """Update drivers list"""
         listbox = self.listbox_spectate
-        driver_list = []
 
-        # Gather relative info for relative sort mode
-        laptime_est = api.read.timing.estimated_laptime()
-        plr_time = api.read.timing.estimated_time_into(selected_index) if selected_index >= 0 else 0
-
-        for driver_index in range(api.read.vehicle.total_vehicles()):
-            driver_name = api.read.vehicle.driver_name(driver_index)
-            driver_place = api.read.vehicle.place(driver_index)
-            driver_class = api.read.vehicle.class_name(driver_index)
-            in_pits = api.read.vehicle.in_pits(driver_index) or api.read.vehicle.in_garage(driver_index)
-            is_yellow = self._check_yellow(driver_index, in_pits)
-            is_blue = api.read.session.blue_flag(driver_index)
-            if driver_index == selected_index or laptime_est <= 0 or selected_index < 0:
-                rel_gap = 0.0
-            else:
-                opt_time = api.read.timing.estimated_time_into(driver_index)
-                diff = opt_time - plr_time
-                diff = diff - diff // laptime_est * laptime_est
-                # Normalize to range (-half_lap, +half_lap]
-                if diff > laptime_est * 0.5:
-                    diff -= laptime_est
-                rel_gap = diff
-
-            driver_list.append((driver_place, driver_class, driver_name, driver_index, rel_gap, in_pits, is_yellow, is_blue))
+        # Read fresh snapshot for user actions, gather relative info for relative sort mode
+        snapshot = read_driver_snapshot()
+        laptime_est = snapshot.laptime_est
+        driver_list, time_into = self._snapshot_drivers(selected_index, snapshot)
+
+        for driver in driver_list:
+            driver_name = driver.name
+            driver_index = driver.index
             if match_name:
                 if driver_name == selected_driver_name:
                     selected_index = driver_index
@@ -389,8 +820,8 @@ class BroadcastList(QWidget):
                     selected_driver_name = driver_name
 
         # Calculate position in class and detect battles
-        class_positions = self._calc_class_positions(driver_list)
-        battles, close = self._find_battles(driver_list, laptime_est)
+        class_groups = self._group_classes(driver_list)
+        proximity = self._cached_proximity(driver_list, laptime_est, time_into)
 
         # If the user has interacted recently, avoid forcing selection changes
         try:
@@ -399,7 +830,8 @@ class BroadcastList(QWidget):
             recent = False
 
         # Populate table; don't force override if recent user action
-        self._populate_table(listbox, driver_list, class_positions, battles, close, laptime_est, force=not recent)
+        self._populate_table(
+            listbox, class_groups, proximity, laptime_est, time_into, force=not recent)
 
         # Only change UI selection and saved index when not recently interacted by user
         # or when explicitly forced by user action (force_save)
@@ -416,21 +848,16 @@ class BroadcastList(QWidget):
                 return
         except Exception:
             pass
-        # For table, find the row with matching UserRole and select it if present
-        row_index = None
-        for r in range(self.listbox_spectate.rowCount()):
-            # Name column moved to index 2 (pos=0, delta=1)
-            it = self.listbox_spectate.item(r, 2)
-            if it and it.data(Qt.UserRole) == driver_name:
-                row_index = r
-                break
-        if row_index is not None:
+        # For table, find the row with matching driver name and select it if present
+        row_index = self._table_model.find_driver(driver_name)
+        if row_index >= 0:
             try:
-                # Select only the name cell (column 1) so the entire row isn't highlighted.
+                # Select only the name cell (column 2) so the entire row isn't highlighted.
                 # This preserves per-column foreground/background colors while making
                 # the selected driver obvious via the name cell only.
                 try:
-                    self.listbox_spectate.setCurrentCell(row_index, 2)
+                    self.listbox_spectate.setCurrentIndex(
+                        self._table_model.index(row_index, COLUMN_NAME))
                 except Exception:
                     # Fallback to selecting the whole row if item-level selection isn't supported
                     self.listbox_spectate.selectRow(row_index)
@@ -443,14 +870,8 @@ class BroadcastList(QWidget):
         """Selected driver name"""
         # Attempt to retrieve selected row's driver name from column 0
         try:
-            sel = self.listbox_spectate.currentRow()
-            if sel is None or sel < 0:
-                return "Anonymous"
-            # Name column is index 2 now
-            it = self.listbox_spectate.item(sel, 2)
-            if it is None:
-                return "Anonymous"
-            return it.data(Qt.UserRole) or it.text() or "Anonymous"
+            sel = self.listbox_spectate.currentIndex().row()
+            return self._table_model.driver_name(sel) or "Anonymous"
         except Exception:
             return "Anonymous"
 
@@ -459,40 +880,70 @@ class BroadcastList(QWidget):
         selected_index = cfg.api["player_index"]
 
         listbox = self.listbox_spectate
-        driver_list = []
 
-        laptime_est = api.read.timing.estimated_laptime()
-        plr_time = api.read.timing.estimated_time_into(selected_index) if selected_index >= 0 else 0
+        snapshot = self._driver_snapshot
+        if snapshot is None:
+            snapshot = read_driver_snapshot()
+        laptime_est = snapshot.laptime_est
+        driver_list, time_into = self._snapshot_drivers(selected_index, snapshot)
         selected_driver_name = "Anonymous"
+        if 0 <= selected_index < len(driver_list):
+            selected_driver_name = driver_list[selected_index].name
 
-        for driver_index in range(api.read.vehicle.total_vehicles()):
-            driver_name = api.read.vehicle.driver_name(driver_index)
-            driver_place = api.read.vehicle.place(driver_index)
-            driver_class = api.read.vehicle.class_name(driver_index)
-            in_pits = api.read.vehicle.in_pits(driver_index) or api.read.vehicle.in_garage(driver_index)
-            is_yellow = self._check_yellow(driver_index, in_pits)
-            is_blue = api.read.session.blue_flag(driver_index)
+        class_groups = self._group_classes(driver_list)
+        proximity = self._cached_proximity(driver_list, laptime_est, time_into)
 
-            if driver_index == selected_index or laptime_est <= 0:
-                rel_gap = 0.0
-            else:
-                opt_time = api.read.timing.estimated_time_into(driver_index)
-                diff = opt_time - plr_time
-                diff = diff - diff // laptime_est * laptime_est
-                if diff > laptime_est * 0.5:
-                    diff -= laptime_est
-                rel_gap = diff
+        # Populate using table implementation (auto-refresh should not override recent user selection)
+        self._populate_table(
+            listbox, class_groups, proximity, laptime_est, time_into, force=False)
+        self.focus_on_selected(selected_driver_name)
 
-            driver_list.append((driver_place, driver_class, driver_name, driver_index, rel_gap, in_pits, is_yellow, is_blue))
-            if driver_index == selected_index:
-                selected_driver_name = driver_name
+    def _snapshot_drivers(self, selected_index: int, snapshot: DriverSnapshot):
+        """Build driver info from driver snapshot once per refresh
 
-        class_positions = self._calc_class_positions(driver_list)
-        battles, close = self._find_battles(driver_list, laptime_est)
+        Returns:
+            driver_list: list of DriverInfo, ordered by driver index.
+            time_into: dict of driver index -> estimated time into lap.
+        """
+        drivers = snapshot.drivers
+        laptime_est = snapshot.laptime_est
+        driver_list = []
+        time_into = {
+            driver_index: reading.time_into for driver_index, reading in enumerate(drivers)}
 
-        # Populate using table implementation (auto-refresh should not override recent user selection)
-        self._populate_table(listbox, driver_list, class_positions, battles, close, laptime_est, force=False)
-        self.focus_on_selected(selected_driver_name)
+        if 0 <= selected_index < len(drivers) and laptime_est > 0:
+            plr_time = time_into[selected_index]
+        else:
+            plr_time = None
+
+        now_ns = monotonic_ns()
+        class_ids = self._class_ids
+        for driver_index, reading in enumerate(drivers):
+            in_pits = reading.in_pits
+            # Hash class name once per snapshot, grouping later uses integer id
+            class_id = class_ids.get(reading.class_name)
+            if class_id is None:
+                class_id = class_ids[reading.class_name] = len(class_ids)
+            if plr_time is None or driver_index == selected_index:
+                rel_gap = 0.0
+            else:
+                # Wrap to range [-half_lap, +half_lap] in a single C call
+                rel_gap = remainder(reading.time_into - plr_time, laptime_est)
+            driver_list.append(DriverInfo(
+                reading.place,
+                reading.class_name,
+                reading.name,
+                driver_index,
+                rel_gap,
+                in_pits,
+                self._check_yellow(driver_index, in_pits, reading.speed, now_ns),
+                reading.is_blue,
+                reading.slot_id,
+                reading.best_laptime,
+                reading.last_laptime,
+                class_id,
+            ))
+        return driver_list, time_into
 
     def reset_caches(self):
         """Clear stored caches (top speeds, yellow timestamps, mappings) and refresh UI."""
@@ -500,10 +951,9 @@ class BroadcastList(QWidget):
             self._top_speeds.clear()
         except Exception:
             pass
-        try:
-            self._yellow_timestamps.clear()
-        except Exception:
-            pass
+        self._yellow_timestamps_ns[:] = [-YELLOW_STICKY_DURATION_NS] * MAX_VEHICLES
+        self._class_ids.clear()
+        self._proximity_cache = (None, None, None)
         try:
             self._slot_row.clear()
         except Exception:
@@ -517,45 +967,59 @@ class BroadcastList(QWidget):
             except Exception:
                 pass
 
-    def _update_speeds(self):
-        """Poll current speeds for all vehicles and update cached top speeds."""
+    def _update_speeds(self, snapshot: DriverSnapshot):
+        """Update cached top speeds from driver snapshot speeds"""
+        top_speeds = self._top_speeds
+        updated = False
+        for reading in snapshot.drivers:
+            # record max speed seen per vehicle slot id (stable across ordering)
+            if reading.speed > top_speeds.get(reading.slot_id, 0.0):
+                top_speeds[reading.slot_id] = reading.speed
+                updated = True
+        # If any top speeds changed, refresh the visible list on next list check
+        if updated:
+            self._list_signature = None
+
+    @Slot()  # type: ignore[operator]
+    def _on_snapshot(self):
+        """Receive latest driver snapshot from producer thread"""
+        snapshot = self._snapshot_producer.take()
         # Only track while broadcast mode enabled
-        if not cfg.api.get("enable_player_index_override", False):
+        if snapshot is None or not cfg.api["enable_player_index_override"]:
+            return
+        self._driver_snapshot = snapshot
+        self._update_speeds(snapshot)
+        self._maybe_refresh_list()
+
+    def _maybe_refresh_list(self):
+        """Refresh driver list if driver set, order or pit status changed
+
+        Gaps and lap times are refreshed every "broadcast_list_update_interval"
+        otherwise (1 s by default), rounded down to multiple of SNAPSHOT_INTERVAL
+        so refresh period never exceeds the setting.
+        """
+        if not cfg.api["enable_player_index_override"] or not self._is_shown():
+            return
+        snapshot = self._driver_snapshot
+        if snapshot is None:
             return
+        signature = tuple((reading.place, reading.in_pits) for reading in snapshot.drivers)
+        self._list_stale_ticks += 1
+        stale_ticks = cfg.api["broadcast_list_update_interval"] // SNAPSHOT_INTERVAL
+        if (self._list_signature == signature
+                and self._list_stale_ticks < stale_ticks):
+            return
+        self._list_signature = signature
+        self._list_stale_ticks = 0
         try:
-            total = api.read.vehicle.total_vehicles()
+            self._refresh_list_only()
         except Exception:
-            return
-        updated = False
-        for idx in range(total):
-            try:
-                slot = api.read.vehicle.slot_id(idx)
-            except Exception:
-                slot = None
-            try:
-                sp = api.read.vehicle.speed(idx)
-                if sp is None or slot is None:
-                    continue
-                # record max speed seen per vehicle slot id (stable across ordering)
-                prev = self._top_speeds.get(slot, 0.0)
-                try:
-                    spf = float(sp)
-                except Exception:
-                    continue
-                if spf > prev:
-                    self._top_speeds[slot] = spf
-                    updated = True
-            except (AttributeError, IndexError):
-                continue
-        # If any top speeds changed, refresh the visible list so column updates
-        if updated:
-            try:
-                self._refresh_list_only()
-            except Exception:
-                pass
+            pass
 
-    def _populate_table(self, table, driver_list, class_positions, battles, close, laptime_est, force: bool = True):
-        """Populate QTableWidget with drivers grouped by class."""
+    def _populate_table(
+        self, table, class_groups, proximity, laptime_est, time_into,
+        force: bool = True):
+        """Populate driver table with drivers grouped by class."""
         # If not forced and the user recently interacted, skip repopulating the table
         if not force:
             try:
@@ -563,47 +1027,54 @@ class BroadcastList(QWidget):
                     return
             except Exception:
                 pass
-        # Clear existing rows but keep headers
-        table.setRowCount(0)
-
-        # Find cars involved in lapping (near a blue-flagged car)
-        lapping = self._find_lappers(driver_list, laptime_est)
-
-        # Group drivers by class
-        class_groups = {}
-        for entry in driver_list:
-            cls = entry[1]
-            class_groups.setdefault(cls, []).append(entry)
-
-        # Sort groups
-        for cls in class_groups:
-            class_groups[cls].sort(key=lambda x: class_positions.get(x[3], x[0]))
-
-        sorted_classes = sorted(class_groups.keys(), key=lambda c: min(e[0] for e in class_groups[c]))
-
-        for cls in sorted_classes:
+        # Batch all cell mutations so Qt only relayouts and repaints once
+        sorting_enabled = table.isSortingEnabled()
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        table.setSortingEnabled(False)
+        try:
+            self._fill_table(table, class_groups, proximity, laptime_est, time_into)
+        finally:
+            table.setSortingEnabled(sorting_enabled)
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+
+    def _fill_table(self, table, class_groups, proximity, laptime_est, time_into):
+        """Fill table model rows, call from _populate_table only"""
+        # Penalties read once per driver per fill
+        self._penalty_cache.clear()
+        battles, close, lapping = proximity
+        model = table.model()
+        column_count = model.columnCount()
+
+        # Update changed rows in place while class grouping and driver order are
+        # unchanged, otherwise reset model and rebuild header row spans
+        layout = tuple(
+            (cls, tuple(e.index for e in drivers)) for cls, drivers in class_groups)
+        total_rows = len(class_groups) + sum(len(drivers) for _, drivers in class_groups)
+        rebuild = self._table_layout != layout or model.rowCount() != total_rows
+        self._table_layout = layout
+        rows = []
+        header_rows = []
+        header_padding = ("",) * (column_count - 1)
+        header_colors = (COLOR_HEADER_TEXT,) * column_count
+        read_vehicle = api.read.vehicle
+        read_lap = api.read.lap
+
+        for cls, drivers in class_groups:
             # Precompute per-class highlights: top speed (max), best lap (min), last lap (min)
             try:
-                indices = [e[3] for e in class_groups[cls]]
+                indices = [e.index for e in drivers]
                 top_vals = {}
+                top_speeds = self._top_speeds
                 best_vals = {}
                 last_vals = {}
-                for idx in indices:
-                    try:
-                        slot = api.read.vehicle.slot_id(idx)
-                    except Exception:
-                        slot = None
-                    top_ms = self._top_speeds.get(slot, self._top_speeds.get(idx, 0.0))
-                    top_vals[idx] = float(top_ms) * 3.6
-                    try:
-                        b = api.read.timing.best_laptime(idx) or 0.0
-                    except Exception:
-                        b = 0.0
+                for driver in drivers:
+                    idx = driver.index
+                    top_vals[idx] = top_speeds.get(driver.slot_id, 0.0) * 3.6
+                    b = driver.best_laptime
                     best_vals[idx] = float(b) if b and b > 0 else float('inf')
-                    try:
-                        l = api.read.timing.last_laptime(idx) or 0.0
-                    except Exception:
-                        l = 0.0
+                    l = driver.last_laptime
                     last_vals[idx] = float(l) if l and l > 0 else float('inf')
                 # Compute starting grid positions within this class (qualification order)
                 class_grid_pos = {}
@@ -612,8 +1083,8 @@ class BroadcastList(QWidget):
                     qual_list = []
                     for idx in indices:
                         try:
-                            qp = api.read.vehicle.qualification(idx)
-                        except Exception:
+                            qp = read_vehicle.qualification(idx)
+                        except (AttributeError, IndexError):
                             qp = None
                         if qp is not None and qp > 0:
                             qual_list.append((int(qp), idx))
@@ -638,78 +1109,34 @@ class BroadcastList(QWidget):
                         last_idx = min(last_vals, key=last_vals.get)
             except Exception:
                 top_idx = best_idx = last_idx = None
-            # Add a header row for the class
-            row = table.rowCount()
-            table.insertRow(row)
-            hdr_item = QTableWidgetItem(f"--- {cls} ---")
-            hdr_item.setFlags(Qt.NoItemFlags)
-            # Make class header more prominent: bolder/larger font and clearer contrast
-            try:
-                tbl_font = table.font()
-                hdr_font = QFont(tbl_font)
-                hdr_font.setBold(True)
-                try:
-                    hdr_font.setPointSize(tbl_font.pointSize() + 2)
-                except Exception:
-                    pass
-                hdr_item.setFont(hdr_font)
-            except Exception:
-                pass
-            hdr_item.setBackground(QColor("#2b2b2b"))
-            hdr_item.setForeground(QColor("#ffffff"))
-            hdr_item.setTextAlignment(Qt.AlignCenter)
-            table.setSpan(row, 0, 1, table.columnCount())
-            table.setItem(row, 0, hdr_item)
-            # Increase header row height for improved readability
-            try:
-                table.setRowHeight(row, UIScaler.pixel(28))
-            except Exception:
-                pass
-
-            # Cache ordered indices and time-into for delta calculations
-            try:
-                ordered_indices = [e[3] for e in class_groups[cls]]
-                pos_in_order = {idx: i for i, idx in enumerate(ordered_indices)}
-                time_into = {idx: api.read.timing.estimated_time_into(idx) for idx in ordered_indices}
-            except Exception:
-                ordered_indices = [e[3] for e in class_groups[cls]]
-                pos_in_order = {idx: i for i, idx in enumerate(ordered_indices)}
-                time_into = {}
-
-            for place, class_name, name, _index, rel_gap, in_pits, is_yellow, is_blue in class_groups[cls]:
-                row = table.rowCount()
-                table.insertRow(row)
-                class_pos = class_positions.get(_index, place)
-                # default text color for this table (used to reset items)
-                try:
-                    default_clr = table.palette().color(QPalette.Text)
-                    default_font = table.font()
-                    bold_font = QFont(default_font)
-                    try:
-                        bold_font.setBold(True)
-                        bold_font.setPointSize(default_font.pointSize() + 2)
-                    except Exception:
-                        pass
-                except Exception:
-                    default_clr = None
-                    default_font = None
-                    bold_font = None
-                # Safely compute VE display: read fraction and format as percent only
-                try:
-                    pct_f = self._read_ve_fraction(_index, allow_global=False)
-                except Exception:
-                    pct_f = None
-                if isinstance(pct_f, (int, float)) and pct_f is not None and pct_f > 0.0:
-                    pct = max(0.0, min(1.0, float(pct_f))) * 100
-                    ve_str = f"{pct:.1f}%"
+            # Add a header row for the class, spans all columns
+            header_rows.append(len(rows))
+            rows.append(TableRow(
+                (f"--- {cls} ---",) + header_padding,
+                header_colors,
+                is_header=True,
+            ))
+
+            # Cache ordered indices for delta calculations
+            ordered_indices = indices
+            pos_in_order = {idx: i for i, idx in enumerate(ordered_indices)}
+
+            for class_pos, (place, class_name, name, _index, rel_gap, in_pits, is_yellow, is_blue,
+                            slot, best_lap, last_lap, _class_id) in enumerate(drivers, 1):
+                # VE display, fraction is already clamped to 0..1 or None if unavailable
+                pct_f = _read_ve_fraction(_index)
+                if pct_f:
+                    ve_str = _format_percent_tenths(round(pct_f * 1000))
                 else:
                     ve_str = ""
-                penalty_tag = self._get_penalty_tag(_index)
-                is_lapping = _index in lapping
+                penalty_tag = self._get_penalty_info(_index)[0]
+                is_battle = battles >> _index & 1
+                is_close = close >> _index & 1
+                is_lapping = lapping >> _index & 1
                 # Determine finished (chequered) state and build status tags
                 try:
-                    finished = api.read.vehicle.finish_state(_index) == 1
-                except Exception:
+                    finished = read_vehicle.finish_state(_index) == 1
+                except (AttributeError, IndexError):
                     finished = False
 
                 # Rules:
@@ -733,9 +1160,9 @@ class BroadcastList(QWidget):
                         tags.append("YELLOW")
                     if is_blue:
                         tags.append("BLUE")
-                if not is_yellow and not is_blue and _index in battles:
+                if not is_yellow and not is_blue and is_battle:
                     tags.append("BATTLE")
-                if not is_yellow and not is_blue and _index in close:
+                if not is_yellow and not is_blue and is_close:
                     tags.append("CLOSE")
                 status_text = " ".join(tags)
 
@@ -743,9 +1170,8 @@ class BroadcastList(QWidget):
                 # Show change indicator: up/down arrow colored green/red when place changes
                 # show class position instead of overall place
                 pos_text = f"{class_pos}"
-                pos_item = QTableWidgetItem(pos_text)
-                pos_item.setTextAlignment(Qt.AlignCenter)
-                pos_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
+                pos_clr = None
+                pos_bold = False
                 # Determine arrow indicator based on change from last known place
                 try:
                     prev = self._last_places.get(_index)
@@ -762,13 +1188,9 @@ class BroadcastList(QWidget):
                             arrow = "▼"
                             arrow_color = COLOR_PENALTY
                         # append arrow to the pos text and store change timestamp so arrow is sticky
-                        pos_item.setText(f"{class_pos} {arrow}")
-                        pos_item.setForeground(arrow_color)
-                        try:
-                            if bold_font is not None:
-                                pos_item.setFont(bold_font)
-                        except Exception:
-                            pass
+                        pos_text = f"{class_pos} {arrow}"
+                        pos_clr = arrow_color
+                        pos_bold = True
                         self._pos_change_info[_index] = (now, direction)
                     else:
                         # If a recent change exists within the sticky window, re-show it
@@ -778,118 +1200,36 @@ class BroadcastList(QWidget):
                             # show arrow for 2.5 seconds
                             if now - ts <= POS_STICKY_DURATION:
                                 arrow = "▲" if dirc == 'up' else "▼"
-                                arrow_color = COLOR_BATTLE if dirc == 'up' else COLOR_PENALTY
-                                pos_item.setText(f"{class_pos} {arrow}")
-                                pos_item.setForeground(arrow_color)
-                                try:
-                                    if bold_font is not None:
-                                        pos_item.setFont(bold_font)
-                                except Exception:
-                                    pass
+                                pos_text = f"{class_pos} {arrow}"
+                                pos_clr = COLOR_BATTLE if dirc == 'up' else COLOR_PENALTY
+                                pos_bold = True
                             else:
                                 # expired
                                 self._pos_change_info.pop(_index, None)
-                                try:
-                                    if default_clr is not None:
-                                        pos_item.setForeground(default_clr)
-                                    if default_font is not None:
-                                        pos_item.setFont(default_font)
-                                except Exception:
-                                    pass
-                        else:
-                            try:
-                                if default_clr is not None:
-                                    pos_item.setForeground(default_clr)
-                                if default_font is not None:
-                                    pos_item.setFont(default_font)
-                            except Exception:
-                                pass
                     # update stored class place
                     self._last_places[_index] = class_pos
                 except Exception:
-                    try:
-                        if default_clr is not None:
-                            pos_item.setForeground(default_clr)
-                    except Exception:
-                        pass
-                table.setItem(row, 0, pos_item)
+                    pass
 
                 # Delta column (between Pos and Name): show gap to car ahead in class
-                try:
-                    iord = pos_in_order.get(_index, None)
-                except Exception:
-                    iord = None
+                iord = pos_in_order.get(_index)
                 delta_str = "--"
                 if iord is not None and iord > 0 and laptime_est and laptime_est > 0:
                     try:
                         prev_idx = ordered_indices[iord - 1]
-                        diff = time_into.get(prev_idx, 0) - time_into.get(_index, 0)
-                        diff = diff - diff // laptime_est * laptime_est
-                        half_lap = laptime_est * 0.5
-                        if diff > half_lap:
-                            diff -= laptime_est
-                        gap = abs(diff)
+                        gap = abs(remainder(
+                            time_into.get(prev_idx, 0) - time_into.get(_index, 0), laptime_est))
                         # Show delta with one decimal place for compactness (no leading plus)
                         delta_str = f"{gap:.1f}"
                     except Exception:
                         delta_str = "--"
-                delta_item = QTableWidgetItem(delta_str)
-                delta_item.setTextAlignment(Qt.AlignCenter)
-                delta_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
                 # color delta similar to battle/close highlights
-                try:
-                    if _index in battles:
-                        delta_item.setForeground(COLOR_BATTLE)
-                    elif _index in close:
-                        delta_item.setForeground(COLOR_CLOSE)
-                    else:
-                        if default_clr is not None:
-                            delta_item.setForeground(default_clr)
-                except Exception:
-                    pass
-                table.setItem(row, 1, delta_item)
-
-                # Name column (left-aligned)
-                name_item = QTableWidgetItem(name)
-                name_item.setData(Qt.UserRole, name)
-                name_item.setTextAlignment(Qt.AlignVCenter | Qt.AlignLeft)
-                # make cell selectable but not editable
-                name_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-                table.setItem(row, 2, name_item)
-
-                # Car name (next to driver name)
-                # Prefer vehicle name from module info (vehicle dataset) which is the actual car
-                # Fallback to reader API when not available
-                car_name = ""
-                try:
-                    try:
-                        veh = minfo.vehicles.dataSet[_index]
-                        car_name = getattr(veh, "vehicleName", "") or car_name
-                    except Exception:
-                        pass
-                    if not car_name:
-                        try:
-                            car_name = api.read.vehicle.vehicle_name(_index) or ""
-                        except Exception:
-                            car_name = ""
-                # Do not map vehicle name to brand/team here; show raw vehicle name
-                except Exception:
-                    car_name = ""
-                # VE: show percentage only (simple text) to avoid widget issues
-                ve_item = QTableWidgetItem(ve_str)
-                ve_item.setTextAlignment(Qt.AlignCenter)
-                ve_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-                # ensure VE cell uses default text color
-                try:
-                    if default_clr is not None:
-                        ve_item.setForeground(default_clr)
-                except Exception:
-                    pass
-                table.setItem(row, 4, ve_item)
-                # Status - center
-                status_item = QTableWidgetItem(status_text)
-                status_item.setTextAlignment(Qt.AlignCenter)
-                status_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
+                if is_battle:
+                    delta_clr = COLOR_BATTLE
+                elif is_close:
+                    delta_clr = COLOR_CLOSE
+                else:
+                    delta_clr = None
 
                 # Determine text color for status and driver name (keep rest unchanged)
                 try:
@@ -902,41 +1242,20 @@ class BroadcastList(QWidget):
                         clr = COLOR_BLUE
                     elif in_pits:
                         clr = COLOR_PIT
-                    elif _index in battles:
+                    elif is_battle:
                         clr = COLOR_BATTLE
-                    elif _index in close:
+                    elif is_close:
                         clr = COLOR_CLOSE
                 except Exception:
                     clr = None
 
-                table.setItem(row, 3, status_item)
-
                 # Top speed (from cache) - center
-                # Try to read top speed by stable slot id if available, fallback to index
-                try:
-                    slot = api.read.vehicle.slot_id(_index)
-                except Exception:
-                    slot = None
-                top_speed_kph = self._top_speeds.get(slot, self._top_speeds.get(_index, 0.0)) * 3.6
-                top_item = QTableWidgetItem(f"{top_speed_kph:.1f} km/h")
-                top_item.setTextAlignment(Qt.AlignCenter)
-                top_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-                table.setItem(row, 5, top_item)
+                # Read top speed by stable slot id
+                top_speed_kph = self._top_speeds.get(slot, 0.0) * 3.6
                 # Highlight highest top speed per class in purple
-                try:
-                    if top_idx is not None and _index == top_idx:
-                        top_item.setForeground(COLOR_HIGHLIGHT)
-                    else:
-                        if default_clr is not None:
-                            top_item.setForeground(default_clr)
-                except Exception:
-                    pass
+                top_clr = COLOR_HIGHLIGHT if top_idx is not None and _index == top_idx else None
 
                 # Best lap - center
-                try:
-                    best_lap = api.read.timing.best_laptime(_index)
-                except Exception:
-                    best_lap = 0.0
                 # Detect new best lap and record lap number when it occurs
                 try:
                     prev_best = self._last_best_lap.get(_index)
@@ -945,8 +1264,8 @@ class BroadcastList(QWidget):
                         if prev_best is None or abs(best_lap - prev_best) > 1e-6:
                             # Use completed_laps as the lap number for the new best
                             try:
-                                lap_num = api.read.lap.completed_laps(_index)
-                            except Exception:
+                                lap_num = read_lap.completed_laps(_index)
+                            except (AttributeError, IndexError):
                                 lap_num = None
                             if lap_num is not None:
                                 self._best_lap_number[_index] = lap_num
@@ -958,151 +1277,101 @@ class BroadcastList(QWidget):
                 except Exception:
                     pass
                 # Format display including lap number if known
-                best_display = self._format_time(best_lap)
+                best_display = _format_time(best_lap)
                 lapnum = self._best_lap_number.get(_index)
                 if lapnum:
                     best_display = f"{best_display} ({lapnum})"
-                best_item = QTableWidgetItem(best_display)
-                best_item.setTextAlignment(Qt.AlignCenter)
-                best_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-                try:
-                    if default_clr is not None:
-                        best_item.setForeground(default_clr)
-                except Exception:
-                    pass
-                table.setItem(row, 6, best_item)
                 # Highlight best lap per class in purple
-                try:
-                    if best_idx is not None and _index == best_idx:
-                        best_item.setForeground(COLOR_HIGHLIGHT)
-                    else:
-                        if default_clr is not None:
-                            best_item.setForeground(default_clr)
-                except Exception:
-                    pass
+                best_clr = COLOR_HIGHLIGHT if best_idx is not None and _index == best_idx else None
 
                 # Last lap time for this driver
-                try:
-                    last_lap = api.read.timing.last_laptime(_index)
-                except Exception:
-                    last_lap = 0.0
-                last_display = self._format_time(last_lap)
-                last_item = QTableWidgetItem(last_display)
-                last_item.setTextAlignment(Qt.AlignCenter)
-                last_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-                try:
-                    if default_clr is not None:
-                        last_item.setForeground(default_clr)
-                except Exception:
-                    pass
-                table.setItem(row, 7, last_item)
                 # Highlight most recent (last) lap per class in purple
-                try:
-                    if last_idx is not None and _index == last_idx:
-                        last_item.setForeground(COLOR_HIGHLIGHT)
-                    else:
-                        if default_clr is not None:
-                            last_item.setForeground(default_clr)
-                except Exception:
-                    pass
+                last_clr = COLOR_HIGHLIGHT if last_idx is not None and _index == last_idx else None
 
                 # Pos Change column - show change vs starting grid (qualification) using arrows
+                pos_change_text = "--"
+                pos_change_clr = None
                 try:
                     # Only compute class-relative grid position change.
-                    curr_pos = api.read.vehicle.place(_index)
-                    pos_change_item = QTableWidgetItem("--")
-                    pos_change_item.setTextAlignment(Qt.AlignCenter)
-                    pos_change_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
+                    curr_pos = read_vehicle.place(_index)
                     # class_grid_pos was computed per-class above; use it if available
                     gpos = class_grid_pos.get(_index)
                     if gpos is not None and curr_pos and curr_pos > 0:
                         # compute class position (class_pos) vs grid class position (gpos)
                         change = gpos - class_pos
                         if change > 0:
-                            pos_change_item.setText(f"▲ {change}")
-                            pos_change_item.setForeground(COLOR_BATTLE)
+                            pos_change_text = f"▲ {change}"
+                            pos_change_clr = COLOR_BATTLE
                         elif change < 0:
-                            pos_change_item.setText(f"▼ {abs(change)}")
-                            pos_change_item.setForeground(COLOR_PENALTY)
+                            pos_change_text = f"▼ {abs(change)}"
+                            pos_change_clr = COLOR_PENALTY
                         else:
-                            pos_change_item.setText("-")
-                            if default_clr is not None:
-                                pos_change_item.setForeground(default_clr)
-                    else:
-                        # unknown starting/grid position within class
-                        pos_change_item.setText("--")
-                        if default_clr is not None:
-                            pos_change_item.setForeground(default_clr)
+                            pos_change_text = "-"
+                    # else unknown starting/grid position within class
                 except Exception:
-                    pos_change_item = QTableWidgetItem("--")
-                    pos_change_item.setTextAlignment(Qt.AlignCenter)
-                    pos_change_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-                    try:
-                        if default_clr is not None:
-                            pos_change_item.setForeground(default_clr)
-                    except Exception:
-                        pass
-                table.setItem(row, 8, pos_change_item)
+                    pos_change_text = "--"
+                    pos_change_clr = None
 
                 # Vehicle integrity column (percentage) - center
                 try:
-                    integrity = api.read.vehicle.integrity(_index)
-                    integrity_pct = int(max(0.0, min(1.0, float(integrity))) * 100)
-                except Exception:
+                    integrity = read_vehicle.integrity(_index)
+                    pct = int(integrity * 100)
+                    integrity_pct = 0 if pct < 0 else 100 if pct > 100 else pct
+                except (AttributeError, IndexError):
                     integrity_pct = 0
-                integrity_item = QTableWidgetItem(f"{integrity_pct}%")
-                integrity_item.setTextAlignment(Qt.AlignCenter)
-                integrity_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-                try:
-                    # Color integrity per thresholds:
-                    # 100% -> green, below 100% -> yellow,
-                    # 100% -> green
-                    # below 50% -> red
-                    # below 87% -> orange
-                    # otherwise yellow
-                    if integrity_pct == 100:
-                        clr_int = COLOR_BATTLE
-                    elif integrity_pct < 50:
-                        clr_int = COLOR_PENALTY
-                    elif integrity_pct < 87:
-                        # show orange when strictly below 87%
-                        clr_int = COLOR_CLOSE
-                    elif integrity_pct < 100:
-                        clr_int = COLOR_YELLOW
-                    else:
-                        clr_int = None
-                    if clr_int is not None:
-                        integrity_item.setForeground(clr_int)
-                    else:
-                        if default_clr is not None:
-                            integrity_item.setForeground(default_clr)
-                except Exception:
-                    try:
-                        if default_clr is not None:
-                            integrity_item.setForeground(default_clr)
-                    except Exception:
-                        pass
-                table.setItem(row, 9, integrity_item)
-
-                # no additional coloring here; text color already applied to name and status
-                # Apply name/status color at end once all columns set so later
-                # per-column highlights don't accidentally overwrite it.
-                try:
-                    if clr is not None:
-                        name_item.setForeground(clr)
-                        status_item.setForeground(clr)
-                    else:
-                        if default_clr is not None:
-                            name_item.setForeground(default_clr)
-                            status_item.setForeground(default_clr)
-                except Exception:
-                    pass
-
-        # ensure table repaints so background changes take effect
-        try:
-            table.viewport().update()
-        except Exception:
-            pass
+                # Color integrity per thresholds:
+                # 100% -> green
+                # below 50% -> red
+                # below 87% -> orange
+                # otherwise yellow
+                if integrity_pct == 100:
+                    clr_int = COLOR_BATTLE
+                elif integrity_pct < 50:
+                    clr_int = COLOR_PENALTY
+                elif integrity_pct < 87:
+                    # show orange when strictly below 87%
+                    clr_int = COLOR_CLOSE
+                else:
+                    clr_int = COLOR_YELLOW
+
+                # Name and status share the status color, None for default text color
+                rows.append(TableRow(
+                    (
+                        pos_text,
+                        delta_str,
+                        name,
+                        status_text,
+                        ve_str,
+                        f"{top_speed_kph:.1f} km/h",
+                        best_display,
+                        _format_time(last_lap),
+                        pos_change_text,
+                        _PERCENT_TEXT[integrity_pct],
+                    ),
+                    (
+                        pos_clr,
+                        delta_clr,
+                        clr,
+                        clr,
+                        None,
+                        top_clr,
+                        best_clr,
+                        last_clr,
+                        pos_change_clr,
+                        clr_int,
+                    ),
+                    name=name,
+                    bold_pos=pos_bold,
+                ))
+
+        model.set_rows(rows, rebuild)
+        if rebuild:
+            # Spans and row heights belong to view, set again after model reset
+            table.clearSpans()
+            for row in header_rows:
+                table.setSpan(row, 0, 1, column_count)
+                # Increase header row height for improved readability
+                table.setRowHeight(row, UIScaler.pixel(28))
 
     @staticmethod
     def save_selected_index(index: int):
@@ -1122,255 +1391,130 @@ class BroadcastList(QWidget):
         if cfg.api["enable_player_index_override"]:
             self.update_drivers(self.selected_name(), cfg.api["player_index"], False)
 
-    def _check_yellow(self, driver_index: int, in_pits: bool) -> bool:
+    def _check_yellow(self, driver_index: int, in_pits: bool, speed: float, now_ns: int) -> bool:
         """Check yellow flag with sticky duration
 
         Returns True if the driver is currently slow on track,
         or was slow within the last YELLOW_STICKY_DURATION seconds.
         """
         if in_pits:
-            self._yellow_timestamps.pop(driver_index, None)
+            self._yellow_timestamps_ns[driver_index] = -YELLOW_STICKY_DURATION_NS
             return False
-        now = monotonic()
-        if api.read.vehicle.speed(driver_index) < YELLOW_SPEED_THRESHOLD:
-            self._yellow_timestamps[driver_index] = now
+        if speed < YELLOW_SPEED_THRESHOLD:
+            self._yellow_timestamps_ns[driver_index] = now_ns
             return True
-        last_yellow = self._yellow_timestamps.get(driver_index)
-        if last_yellow is not None and now - last_yellow < YELLOW_STICKY_DURATION:
-            return True
-        self._yellow_timestamps.pop(driver_index, None)
-        return False
+        # Expired timestamps simply fail the sticky test, no need to reset
+        return now_ns - self._yellow_timestamps_ns[driver_index] < YELLOW_STICKY_DURATION_NS
 
     @staticmethod
-    def _calc_class_positions(driver_list):
-        """Calculate position in class for each driver
+    def _group_classes(driver_list) -> list:
+        """Group drivers by class in a single pass
 
         Args:
-            driver_list: list of (place, class_name, name, index, rel_gap).
+            driver_list: list of DriverInfo.
 
         Returns:
-            dict mapping driver index to position in class.
+            list of (class_name, drivers), ordered by best overall place in class.
+            drivers: list of DriverInfo sorted by overall place,
+                position in class is list position + 1.
         """
-        # Group by class, sorted by overall position within each class
         classes = {}
-        for place, class_name, _name, driver_index, *_ in driver_list:
-            classes.setdefault(class_name, []).append((place, driver_index))
+        for driver in driver_list:
+            classes.setdefault(driver.class_id, []).append(driver)
+        for drivers in classes.values():
+            drivers.sort(key=_overall_place)  # stable, ties keep driver index order
+        return sorted(
+            ((drivers[0].class_name, drivers) for drivers in classes.values()),
+            key=_class_leader_place,
+        )
 
-        class_positions = {}
-        for entries in classes.values():
-            entries.sort()  # sort by overall place
-            for pos, (_, driver_index) in enumerate(entries, 1):
-                class_positions[driver_index] = pos
-        return class_positions
+    def _cached_proximity(self, driver_list, laptime_est, time_into) -> ProximityInfo:
+        """Proximity info, reuse last result if nothing relevant changed
+
+        Last result is reused while pit, flag and class state of all drivers
+        is unchanged, and no driver has drifted more than PROXIMITY_GAP_TOLERANCE
+        relative to others since last analysis. All drivers advance together
+        with elapsed time, so drift is measured against the first driver.
+        """
+        state = (laptime_est, tuple(
+            (driver.index, driver.class_id, driver.in_pits, driver.is_blue, driver.is_yellow)
+            for driver in driver_list
+        ))
+        last_state, last_time_into, last_proximity = self._proximity_cache
+        if state == last_state and laptime_est > 0:
+            shift = None
+            for idx, seconds in time_into.items():
+                delta = seconds - last_time_into[idx]
+                if shift is None:
+                    shift = delta
+                elif abs(remainder(delta - shift, laptime_est)) > PROXIMITY_GAP_TOLERANCE:
+                    break
+            else:
+                return last_proximity
+        proximity = self._analyze_proximity(driver_list, laptime_est, time_into)
+        self._proximity_cache = (state, time_into, proximity)
+        return proximity
 
     @staticmethod
-    def _find_battles(driver_list, laptime_est):
-        """Find drivers within proximity thresholds of a same-class car on track
+    def _analyze_proximity(driver_list, laptime_est, time_into) -> ProximityInfo:
+        """Find battles, close racing and lapping in a single pass over drivers
 
         Drivers in pits are excluded.
 
         Returns:
-            tuple of (battles, close) sets of driver indices.
-            battles: within BATTLE_THRESHOLD (< 1s).
-            close: within CLOSE_THRESHOLD (< 2s) but not in battles.
+            ProximityInfo of (battles, close, lapping) bitmasks of driver indices.
+            battles: same-class cars within BATTLE_THRESHOLD,
+                excluding yellow and blue flagged cars.
+            close: same-class cars within CLOSE_THRESHOLD but not in battles.
+            lapping: non-blue cars within LAPPING_THRESHOLD of a blue-flagged car.
         """
-        battles = set()
-        close = set()
+        battles = 0
+        close = 0
+        lapping = 0
         if laptime_est <= 0:
-            return battles, close
+            return ProximityInfo(battles, close, lapping)
 
-        # Group on-track drivers by class (exclude pitting, yellow, blue flagged)
+        # Partition on-track drivers once
         classes = {}
-        for _place, cls, _name, idx, _gap, in_pits, is_yellow, is_blue in driver_list:
-            if not in_pits and not is_yellow and not is_blue:
-                classes.setdefault(cls, []).append(idx)
-
-        half_lap = laptime_est * 0.5
-
-        for indices in classes.values():
-            if len(indices) < 2:
-                continue
-            # Collect estimated time into lap for each driver in class
-            time_into = {idx: api.read.timing.estimated_time_into(idx) for idx in indices}
-            for i in range(len(indices)):
-                for j in range(i + 1, len(indices)):
-                    diff = time_into[indices[j]] - time_into[indices[i]]
-                    diff = diff - diff // laptime_est * laptime_est
-                    if diff > half_lap:
-                        diff -= laptime_est
-                    gap = abs(diff)
-                    if gap <= BATTLE_THRESHOLD:
-                        battles.add(indices[i])
-                        battles.add(indices[j])
-                    elif gap <= CLOSE_THRESHOLD:
-                        close.add(indices[i])
-                        close.add(indices[j])
-        # Remove from close any that are already in battles
-        close -= battles
-        return battles, close
-
-    @staticmethod
-    def _find_lappers(driver_list, laptime_est):
-        """Find non-blue drivers near a blue-flagged car (the lapper)
-
-        Returns:
-            set of driver indices that are lapping a blue-flagged car.
-        """
-        lapping = set()
-        if laptime_est <= 0:
-            return lapping
-
         blue_drivers = []
         non_blue_drivers = []
-        for _place, _cls, _name, idx, _gap, in_pits, _is_yellow, is_blue in driver_list:
-            if in_pits:
+        for driver in driver_list:
+            if driver.in_pits:
                 continue
-            if is_blue:
+            idx = driver.index
+            if driver.is_blue:
                 blue_drivers.append(idx)
-            else:
-                non_blue_drivers.append(idx)
-
-        if not blue_drivers:
-            return lapping
-
-        half_lap = laptime_est * 0.5
-        # Cache time-into-lap for relevant drivers
-        time_into = {}
-        for idx in blue_drivers:
-            time_into[idx] = api.read.timing.estimated_time_into(idx)
-        for idx in non_blue_drivers:
-            time_into[idx] = api.read.timing.estimated_time_into(idx)
-
-        for b_idx in blue_drivers:
-            for nb_idx in non_blue_drivers:
-                diff = time_into[nb_idx] - time_into[b_idx]
-                diff = diff - diff // laptime_est * laptime_est
-                if diff > half_lap:
-                    diff -= laptime_est
-                if abs(diff) <= LAPPING_THRESHOLD:
-                    lapping.add(nb_idx)
-
-        return lapping
-
-    @staticmethod
-    def _format_time(seconds: float) -> str:
-        """Format time value for display"""
-        if seconds <= 0 or seconds >= MAX_SECONDS:
-            return "-:--.---"
-        return sec2laptime(seconds)
-
-    @staticmethod
-    def _format_ve(driver_index: int) -> str:
-        """Format virtual energy remaining for driver list"""
-        # Use only per-index readers for the driver list (no global LMU fallback)
-        pct_f = BroadcastList._read_ve_fraction(driver_index, allow_global=False)
-        # Hide the bar for vehicles that don't support VE or return 0
-        if pct_f is None or pct_f <= 0.0:
-            return ""
-        pct = int(max(0.0, min(1.0, pct_f)) * 100)
-        # Show only percentage value (no bar) in the driver list
-        return f"{pct:3d}%"
-
-    @staticmethod
-    def _read_ve_fraction(driver_index: int, allow_global: bool = True) -> float | None:
-        """Read virtual energy and return fraction 0..1 or None if unavailable.
-
-        This helper centralizes logic so the driver list and the bottom
-        progress bar use the same source and interpretation.
-        """
-        try:
-            # Try legacy minfo dataset first (fraction 0..1)
-            try:
-                veh = minfo.vehicles.dataSet[driver_index]
-                if getattr(veh, "driverName", "") and hasattr(veh, "energyRemaining"):
-                    ve_legacy = getattr(veh, "energyRemaining")
-                    if ve_legacy is not None and ve_legacy > -1.0:
-                        return max(0.0, min(1.0, float(ve_legacy)))
-            except Exception:
-                pass
-
-            # Reader API: attempt to read both ve and max_e and infer units
-            ve = None
-            max_e = None
-            try:
-                ve = api.read.vehicle.virtual_energy(driver_index)
-            except Exception:
-                ve = None
-            try:
-                max_e = api.read.vehicle.max_virtual_energy(driver_index)
-            except Exception:
-                max_e = None
-
-            if ve is None:
-                return None
-
-            # If max_e present and non-zero, treat ve as absolute and compute fraction
-            if max_e:
-                try:
-                    return max(0.0, min(1.0, float(ve) / float(max_e)))
-                except Exception:
-                    return None
+                continue
+            non_blue_drivers.append(idx)
+            if not driver.is_yellow:
+                classes.setdefault(driver.class_id, []).append(idx)
 
-            # If ve present but no max_e, infer whether ve is percent (0-100) or fraction
-            try:
-                v = float(ve)
-                if v > 1.0:
-                    return max(0.0, min(1.0, v / 100.0))
-                return max(0.0, min(1.0, v))
-            except Exception:
-                return None
-        except (AttributeError, IndexError):
-            return None
-        try:
-            # First try legacy module data which may be available for all cars
-            try:
-                veh = minfo.vehicles.dataSet[driver_index]
-                if not veh.driverName:
-                    return "               "
-                ve_legacy = getattr(veh, "energyRemaining", None)
-                if ve_legacy is not None and ve_legacy > -1.0:
-                    # legacy value is fraction 0..1
-                    pct_f = max(0.0, min(1.0, float(ve_legacy)))
-                    pct = int(pct_f * 100)
-                    filled = pct // 10
-                    bar = "|" * filled + "." * (10 - filled)
-                    return f"[{bar}]{pct:3d}%"
-            except Exception:
-                # ignore and fall back to reader API
-                pass
-            # Fall back to reader API when legacy data not available.
-            # Support both absolute (ve/max_e) and percentage (0-100) readers.
-            try:
-                ve = api.read.vehicle.virtual_energy(driver_index)
-            except Exception:
-                ve = None
-            try:
-                max_e = api.read.vehicle.max_virtual_energy(driver_index)
-            except Exception:
-                max_e = None
+        # Battles & close, same class only, sweep neighbours sorted by time into lap
+        for indices in classes.values():
+            if len(indices) < 2:
+                continue
+            for idx_a, idx_b, gap in _near_pairs(time_into, indices, laptime_est, CLOSE_THRESHOLD):
+                if gap <= BATTLE_THRESHOLD:
+                    battles |= 1 << idx_a | 1 << idx_b
+                elif gap <= CLOSE_THRESHOLD:
+                    close |= 1 << idx_a | 1 << idx_b
+        # Remove from close any that are already in battles
+        close &= ~battles
+
+        # Lapping, any class, sweep blue and non-blue drivers merged
+        if blue_drivers and non_blue_drivers:
+            blue_set = set(blue_drivers)
+            for idx_a, idx_b, gap in _near_pairs(
+                time_into, blue_drivers + non_blue_drivers, laptime_est, LAPPING_THRESHOLD):
+                if gap > LAPPING_THRESHOLD:
+                    continue
+                if idx_a in blue_set:
+                    if idx_b not in blue_set:
+                        lapping |= 1 << idx_b
+                elif idx_b in blue_set:
+                    lapping |= 1 << idx_a
 
-            pct_f = None
-            if ve is not None and max_e:
-                try:
-                    pct_f = float(ve) / float(max_e) if float(max_e) != 0 else None
-                except Exception:
-                    pct_f = None
-            elif ve is not None:
-                try:
-                    v = float(ve)
-                    pct_f = v / 100.0 if v > 1.0 else v
-                except Exception:
-                    pct_f = None
-
-            if pct_f is None:
-                return "               "
-            pct_f = max(0.0, min(1.0, pct_f))
-            pct = int(pct_f * 100)
-            filled = pct // 10
-            bar = "|" * filled + "." * (10 - filled)
-            return f"[{bar}]{pct:3d}%"
-        except (AttributeError, IndexError):
-            return "               "
+        return ProximityInfo(battles, close, lapping)
 
     def _get_stint_average(self, driver_index: int) -> float | None:
         """Compute average lap time for current stint for a driver.
@@ -1394,303 +1538,23 @@ class BroadcastList(QWidget):
             return None
         return None
 
-    @staticmethod
-    def _get_penalty_tag(driver_index: int) -> str:
-        """Get penalty tag for driver (DT, SG, etc)
-        
-        Note: mCountLapFlag indicates lap counting behavior during penalty,
-        not necessarily the penalty type. This is a best-effort detection.
-        """
-        try:
-            penalties = api.read.vehicle.number_penalties(driver_index)
-            if penalties <= 0:
-                return ""
-            # Try to read mCountLapFlag to determine penalty type
-            # 0 = stop & go (don't count lap or time)
-            # 1 = drive through (count lap but not time)
-            # 2 = normal (count lap and time - no penalty)
-            try:
-                count_lap_flag = api.shmm.lmuScorVeh(driver_index).mCountLapFlag
-                if count_lap_flag == 0:
-                    return f"SG({penalties})"
-                elif count_lap_flag == 1:
-                    return f"DT({penalties})"
-            except (AttributeError, IndexError):
-                pass
-            # Fallback - just show penalty count
-            return f"PEN({penalties})"
-        except (AttributeError, IndexError):
-            return ""
-
-    @staticmethod
-    def _get_penalty_reason(driver_index: int) -> str:
-        """Get penalty reason for selected driver"""
-        try:
-            penalties = api.read.vehicle.number_penalties(driver_index)
-            if penalties > 0:
-                try:
-                    count_lap_flag = api.shmm.lmuScorVeh(driver_index).mCountLapFlag
-                    if count_lap_flag == 0:
-                        penalty_type = "Stop & Go"
-                    elif count_lap_flag == 1:
-                        penalty_type = "Drive Through"
-                    else:
-                        penalty_type = "Penalty"
-                except (AttributeError, IndexError):
-                    penalty_type = "Penalty"
-                return f"{penalty_type} ({penalties} pending)"
-            return ""
-        except (AttributeError, IndexError):
-            return ""
-
-    def _reset_timing(self):
-        """Reset timing and damage labels to default"""
-        self.label_current_lap.setText("--")
-        self.label_best_lap.setText("--")
-        self.label_last_lap.setText("--")
-        self.label_sector1.setText("--")
-        self.label_sector2.setText("--")
-        self.label_sector3.setText("--")
-        self.label_best_s1.setText("--")
-        self.label_best_s2.setText("--")
-        self.label_best_s3.setText("--")
-        self.label_gap_leader.setText("--")
-        self.label_gap_next.setText("--")
-        self.label_laps.setText("--")
-        self.label_speed.setText("--")
-        self.label_top_speed.setText("--")
-        self._top_speeds.clear()
-        self.label_penalty.setText("--")
-        self.label_integrity.setText("Integrity: --")
-        self.bar_integrity.setValue(100)
-        self.bar_integrity.setStyleSheet(
-            "QProgressBar { background: #444; border: none; border-radius: 3px; }"
-            "QProgressBar::chunk { background: #2ecc71; border-radius: 3px; }"
-        )
-        self.label_body.setText("Body: OK")
-        self.label_aero.setText("Aero: OK")
-        self.label_susp.setText("Susp: OK")
-        self.label_detached.setText("")
-        self.label_energy.setText("Energy: --")
-        self.bar_energy.setValue(0)
-        self.bar_energy.setStyleSheet(
-            "QProgressBar { background: #333; border: 1px solid #555; border-radius: 4px; }"
-            "QProgressBar::chunk { background: qlineargradient("
-            "x1:0, y1:0, x2:1, y2:0, stop:0 #2980b9, stop:1 #3498db); border-radius: 3px; }"
-        )
-
-    def _update_timing(self):
-        """Update live timing and damage for spectated driver"""
-        if not cfg.api["enable_player_index_override"]:
-            return
-
-        # Auto-refresh driver list (~every 0.5s)
-        self._list_update_counter += 1
-        if self._list_update_counter >= 5:
-            self._list_update_counter = 0
-            self._refresh_list_only()
-
-        index = cfg.api["player_index"]
-        if index < 0:
-            return
-
-        try:
-            total = api.read.vehicle.total_vehicles()
-            if index >= total:
-                return
-
-            # Current lap time
-            current = api.read.timing.current_laptime(index)
-            self.label_current_lap.setText(f"<b>{self._format_time(current)}</b>")
-
-            # Lap count
-            laps = api.read.lap.completed_laps(index)
-            self.label_laps.setText(f"<b>{laps}</b>")
-
-            # Best & last lap
-            best = api.read.timing.best_laptime(index)
-            last = api.read.timing.last_laptime(index)
-            # Detect new best lap and record lap number
-            try:
-                prev_best = self._last_best_lap.get(index)
-                if best and best > 0:
-                    if prev_best is None or abs(best - prev_best) > 1e-6:
-                        try:
-                            lap_num = api.read.lap.completed_laps(index)
-                        except Exception:
-                            lap_num = None
-                        if lap_num is not None:
-                            self._best_lap_number[index] = lap_num
-                        self._last_best_lap[index] = best
-                else:
-                    self._last_best_lap.pop(index, None)
-                    self._best_lap_number.pop(index, None)
-            except Exception:
-                pass
-            best_disp = self._format_time(best)
-            lapnum = self._best_lap_number.get(index)
-            if lapnum:
-                best_disp = f"{best_disp} ({lapnum})"
-            self.label_best_lap.setText(f"<b>{best_disp}</b>")
-            self.label_last_lap.setText(f"<b>{self._format_time(last)}</b>")
-
-            # Current sectors
-            cur_s1 = api.read.timing.current_sector1(index)
-            cur_s2 = api.read.timing.current_sector2(index)
-            last_s1 = api.read.timing.last_sector1(index)
-            last_s2 = api.read.timing.last_sector2(index)
-            last_lap = api.read.timing.last_laptime(index)
-
-            # Derive individual sector times
-            s1_time = cur_s1 if cur_s1 > 0 else last_s1
-            s2_time = (cur_s2 - cur_s1) if cur_s1 > 0 and cur_s2 > 0 else (
-                (last_s2 - last_s1) if last_s1 > 0 and last_s2 > 0 else 0)
-            s3_time = (last_lap - last_s2) if last_s2 > 0 and last_lap > 0 else 0
-
-            self.label_sector1.setText(f"<b>{self._format_time(s1_time)}</b>")
-            self.label_sector2.setText(f"<b>{self._format_time(s2_time)}</b>")
-            self.label_sector3.setText(f"<b>{self._format_time(s3_time)}</b>")
-
-            # Best sectors
-            best_s1 = api.read.timing.best_sector1(index)
-            best_s2 = api.read.timing.best_sector2(index)
-            best_s2_individual = (best_s2 - best_s1) if best_s1 > 0 and best_s2 > 0 else 0
-            best_s3 = (best - best_s2) if best_s2 > 0 and best > 0 else 0
-
-            self.label_best_s1.setText(f"<b>{self._format_time(best_s1)}</b>")
-            self.label_best_s2.setText(f"<b>{self._format_time(best_s2_individual)}</b>")
-            self.label_best_s3.setText(f"<b>{self._format_time(best_s3)}</b>")
-
-            # Gaps
-            gap_leader = api.read.timing.behind_leader(index)
-            gap_next = api.read.timing.behind_next(index)
-            gap_leader_str = f"<b>+{gap_leader:.3f}</b>" if gap_leader > 0 else "--"
-            gap_next_str = f"<b>+{gap_next:.3f}</b>" if gap_next > 0 else "--"
-            self.label_gap_leader.setText(gap_leader_str)
-            self.label_gap_next.setText(gap_next_str)
-
-            # Speed & top speed
-            speed_ms = api.read.vehicle.speed(index)
-            speed_kph = speed_ms * 3.6
-            if index not in self._top_speeds or speed_ms > self._top_speeds[index]:
-                self._top_speeds[index] = speed_ms
-            top_speed_kph = self._top_speeds[index] * 3.6
-            self.label_speed.setText(f"<b>{speed_kph:.1f} km/h</b>")
-            self.label_top_speed.setText(f"<b>{top_speed_kph:.1f} km/h</b>")
-
-            # Penalty
-            penalty_reason = self._get_penalty_reason(index)
-            if penalty_reason:
-                self.label_penalty.setText(f"<b style='color:#e74c3c'>{penalty_reason}</b>")
-            else:
-                self.label_penalty.setText("--")
-
-            # Damage & energy
-            self._update_damage(index)
-            self._update_energy(index)
-
-        except (AttributeError, IndexError):
-            pass
-
-    def _update_energy(self, index: int):
-        """Update virtual energy bar for spectated driver"""
-        try:
-            # Use centralized reader to get fraction 0..1 so list and bar match
-            pct_e = BroadcastList._read_ve_fraction(index)
-            if pct_e is None:
-                self.bar_energy.setValue(0)
-                self.label_energy.setText("Energy: <b>N/A</b>")
-                return
-            pct_e = max(0.0, min(1.0, pct_e))
-            pct_e_int = int(pct_e * 1000)
-            self.bar_energy.setValue(pct_e_int)
-            self.label_energy.setText(f"Energy: <b>{pct_e:.1%}</b>")
-            if pct_e > 0.4:
-                color = "qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #2980b9, stop:1 #3498db)"
-            elif pct_e > 0.15:
-                color = "qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #d35400, stop:1 #f39c12)"
-            else:
-                color = "qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #c0392b, stop:1 #e74c3c)"
-            self.bar_energy.setStyleSheet(
-                "QProgressBar { background: #333; border: 1px solid #555; border-radius: 4px; }"
-                f"QProgressBar::chunk {{ background: {color}; border-radius: 3px; }}"
-            )
-        except (AttributeError, IndexError):
-            pass
-
-    def _update_damage(self, index: int):
-        """Update damage indicators for spectated driver"""
-        try:
-            # Integrity
-            integrity = api.read.vehicle.integrity(index)
-            pct = max(0, min(100, int(integrity * 100)))
-            self.label_integrity.setText(f"Integrity: <b>{pct}%</b>")
-            self.bar_integrity.setValue(pct)
-            if pct > 70:
-                color = "#2ecc71"  # green
-            elif pct > 40:
-                color = "#f39c12"  # orange
-            else:
-                color = "#e74c3c"  # red
-            self.bar_integrity.setStyleSheet(
-                "QProgressBar { background: #444; border: none; border-radius: 3px; }"
-                f"QProgressBar::chunk {{ background: {color}; border-radius: 3px; }}"
-            )
-
-            # Body damage
-            dmg = api.read.vehicle.damage_severity(index)
-            body_total = sum(dmg)
-            if body_total == 0:
-                self.label_body.setText("Body: <b>OK</b>")
-            elif body_total <= 4:
-                self.label_body.setText(f"Body: <b style='color:#f39c12'>Minor ({body_total})</b>")
-            else:
-                self.label_body.setText(f"Body: <b style='color:#e74c3c'>Heavy ({body_total})</b>")
-
-            # Aero damage
-            aero = api.read.vehicle.aero_damage(index)
-            # aero may be None or a fraction 0.0-1.0
-            if aero is None or aero <= 0:
-                self.label_aero.setText("Aero: <b>OK</b>")
-            else:
-                # Use percent display and color thresholds
-                try:
-                    if aero < 0.5:
-                        self.label_aero.setText(f"Aero: <b style='color:#f39c12'>{aero:.0%}</b>")
-                    else:
-                        self.label_aero.setText(f"Aero: <b style='color:#e74c3c'>{aero:.0%}</b>")
-                except Exception:
-                    self.label_aero.setText("Aero: <b>N/A</b>")
-
-            # Suspension damage
-            # suspension_damage() returns a tuple of per-wheel fractions (0.0-1.0)
-            susp = api.read.wheel.suspension_damage(index)
-            try:
-                if not susp:
-                    max_susp = 0.0
-                else:
-                    # consider the worst wheel
-                    max_susp = max(float(x) for x in susp)
-            except Exception:
-                max_susp = 0.0
-
-            # Thresholds (match widget defaults): light, medium, heavy, totaled
-            if max_susp <= 0:
-                self.label_susp.setText("Susp: <b>OK</b>")
-            elif max_susp < 0.02:
-                self.label_susp.setText(f"Susp: <b style='color:#f39c12'>Minor</b>")
-            elif max_susp < 0.15:
-                self.label_susp.setText(f"Susp: <b style='color:#f39c12'>Light</b>")
-            elif max_susp < 0.4:
-                self.label_susp.setText(f"Susp: <b style='color:#e74c3c'>Heavy</b>")
-            else:
-                self.label_susp.setText(f"Susp: <b style='color:#e74c3c'>Totaled</b>")
+    def _get_penalty_info(self, driver_index: int) -> tuple[str, str]:
+        """Get penalty (tag, reason) for driver
 
-            # Detached parts
-            if api.read.vehicle.is_detached(index):
-                self.label_detached.setText("<b style='color:#e74c3c'>PARTS DETACHED</b>")
-            else:
-                self.label_detached.setText("")
-
-        except (AttributeError, IndexError):
-            pass
+        Tag is shown in driver list (DT, SG, etc).
+        Penalty state is read once per driver per table fill.
+        """
+        penalty = self._penalty_cache.get(driver_index)
+        if penalty is None:
+            penalty = self._penalty_cache[driver_index] = _read_penalty(driver_index)
+        penalties, count_lap_flag = penalty
+        if penalties <= 0:
+            return "", ""
+        return _format_penalty(penalties, count_lap_flag)
+
+    def _is_shown(self) -> bool:
+        """Whether view is on screen, False if hidden or main window minimized
+
+        Minimized windows still report visible, so check window state as well.
+        """
+        return self.isVisible() and not self.window().isMinimized()
@@ -383,6 +383,19 @@ class GearGaugeBar(QWidget):
 class RawText(QWidget):
     """Raw text widget for optimized drawing"""
 
+    __slots__ = (
+        "state",
+        "last",
+        "text",
+        "fg",
+        "bg",
+        "_alignment",
+        "_offset_y",
+        "_pen_text",
+        "_width",
+        "_height",
+    )
+
     def __init__(
         self,
         parent,
@@ -429,6 +442,13 @@ class RawText(QWidget):
         self.fg = Qt.transparent
         self.bg = Qt.transparent
 
+    def apply(self, text: str, fg: str, bg: str):
+        """Set text & colors, then schedule a single repaint"""
+        self.text = text
+        self.fg = fg
+        self.bg = bg
+        self.update()
+
     def resizeEvent(self, event):
         """Update size info"""
         self._width = self.width()
@@ -20,6 +20,9 @@
 Flag Widget
 """
 
+from functools import lru_cache, partial
+from typing import Callable
+
 from .. import calculation as calc
 from .. import units
 from ..api_control import api
@@ -49,48 +52,58 @@ class Realtime(Overlay):
         # Config variable
         bar_padx = self.set_padding(self.wcfg["font_size"], self.wcfg["bar_padding"])
         bar_width = font_m.width * 7 + bar_padx
+        set_bar = partial(
+            self.set_rawtext,
+            width=bar_width,
+            fixed_height=font_m.height,
+            offset_y=font_m.voffset,
+        )
+
+        # Config enabled state, read once instead of per update
+        self.show_pit_timer = self.wcfg["show_pit_timer"]
+        self.show_low_fuel = self.wcfg["show_low_fuel"]
+        self.show_speed_limiter = self.wcfg["show_speed_limiter"]
+        self.show_yellow_flag = self.wcfg["show_yellow_flag"]
+        self.show_blue_flag = self.wcfg["show_blue_flag"]
+        self.show_startlights = self.wcfg["show_startlights"]
+        self.show_traffic = self.wcfg["show_traffic"]
+        self.show_pit_request = self.wcfg["show_pit_request"]
+        self.show_finish_state = self.wcfg["show_finish_state"]
 
         # Config units
         self.unit_fuel = units.set_unit_fuel(self.cfg.units["fuel_unit"])
         self.unit_dist = units.set_unit_distance(self.cfg.units["distance_unit"])
-        self.symbol_dist = units.set_symbol_distance(self.cfg.units["distance_unit"])
+        self.yellow_text = set_yellow_text(
+            units.set_symbol_distance(self.cfg.units["distance_unit"]))
 
         # Pit status
-        if self.wcfg["show_pit_timer"]:
-            self.bar_style_pit_timer = (
-                (
-                    self.wcfg["font_color_pit_timer"],
-                    self.wcfg["bkg_color_pit_timer"],
-                ),
-                (
-                    self.wcfg["font_color_pit_timer_stopped"],
-                    self.wcfg["bkg_color_pit_timer_stopped"],
-                ),
-                (
-                    self.wcfg["font_color_pit_closed"],
-                    self.wcfg["bkg_color_pit_closed"],
-                ),
+        if self.show_pit_timer:
+            # Foreground & background colors, indexed by pit timer color index
+            self.fg_pit_timer = (
+                self.wcfg["font_color_pit_timer"],
+                self.wcfg["font_color_pit_timer_stopped"],
+                self.wcfg["font_color_pit_closed"],
             )
-            self.bar_pit_timer = self.set_rawtext(
+            self.bg_pit_timer = (
+                self.wcfg["bkg_color_pit_timer"],
+                self.wcfg["bkg_color_pit_timer_stopped"],
+                self.wcfg["bkg_color_pit_closed"],
+            )
+            self.bar_pit_timer = set_bar(
                 text="PITST0P",
-                width=bar_width,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
-                fg_color=self.bar_style_pit_timer[0][0],
-                bg_color=self.bar_style_pit_timer[0][1],
+                fg_color=self.fg_pit_timer[0],
+                bg_color=self.bg_pit_timer[0],
             )
             self.set_primary_orient(
                 target=self.bar_pit_timer,
                 column=self.wcfg["column_index_pit_timer"],
             )
+            self.pit_closed_text = self.wcfg["pit_closed_text"]
 
         # Low fuel warning
-        if self.wcfg["show_low_fuel"]:
-            self.bar_lowfuel = self.set_rawtext(
+        if self.show_low_fuel:
+            self.bar_lowfuel = set_bar(
                 text="LOWFUEL",
-                width=bar_width,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.wcfg["font_color_low_fuel"],
                 bg_color=self.wcfg["bkg_color_low_fuel"],
             )
@@ -98,14 +111,16 @@ class Realtime(Overlay):
                 target=self.bar_lowfuel,
                 column=self.wcfg["column_index_low_fuel"],
             )
+            self.lowfuel_race_only = self.wcfg["show_low_fuel_for_race_only"]
+            self.lowfuel_volume_threshold = self.wcfg["low_fuel_volume_threshold"]
+            self.lowfuel_lap_threshold = self.wcfg["low_fuel_lap_threshold"]
+            self.last_lowfuel_key = None
+            self.last_lowfuel_text = ""
 
         # Speed limiter
-        if self.wcfg["show_speed_limiter"]:
-            self.bar_limiter = self.set_rawtext(
+        if self.show_speed_limiter:
+            self.bar_limiter = set_bar(
                 text=self.wcfg["speed_limiter_text"],
-                width=bar_width,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.wcfg["font_color_speed_limiter"],
                 bg_color=self.wcfg["bkg_color_speed_limiter"],
             )
@@ -115,12 +130,9 @@ class Realtime(Overlay):
             )
 
         # Yellow flag
-        if self.wcfg["show_yellow_flag"]:
-            self.bar_yellowflag = self.set_rawtext(
+        if self.show_yellow_flag:
+            self.bar_yellowflag = set_bar(
                 text="YELLOW",
-                width=bar_width,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.wcfg["font_color_yellow_flag"],
                 bg_color=self.wcfg["bkg_color_yellow_flag"],
             )
@@ -128,14 +140,14 @@ class Realtime(Overlay):
                 target=self.bar_yellowflag,
                 column=self.wcfg["column_index_yellow_flag"],
             )
+            self.yellow_race_only = self.wcfg["show_yellow_flag_for_race_only"]
+            self.yellow_range_ahead = self.wcfg["yellow_flag_maximum_range_ahead"]
+            self.yellow_range_behind = -self.wcfg["yellow_flag_maximum_range_behind"]
 
         # Blue flag
-        if self.wcfg["show_blue_flag"]:
-            self.bar_blueflag = self.set_rawtext(
+        if self.show_blue_flag:
+            self.bar_blueflag = set_bar(
                 text="BLUE",
-                width=bar_width,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.wcfg["font_color_blue_flag"],
                 bg_color=self.wcfg["bkg_color_blue_flag"],
             )
@@ -145,16 +157,13 @@ class Realtime(Overlay):
             )
 
         # Start lights
-        if self.wcfg["show_startlights"]:
+        if self.show_startlights:
             self.bar_style_startlights = (
                 self.wcfg["bkg_color_red_lights"],
                 self.wcfg["bkg_color_green_flag"],
             )
-            self.bar_startlights = self.set_rawtext(
+            self.bar_startlights = set_bar(
                 text="SLIGHTS",
-                width=bar_width,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.wcfg["font_color_startlights"],
                 bg_color=self.bar_style_startlights[0],
             )
@@ -162,14 +171,13 @@ class Realtime(Overlay):
                 target=self.bar_startlights,
                 column=self.wcfg["column_index_startlights"],
             )
+            self.red_lights_prefix = f"{self.wcfg['red_lights_text'][:6]: <6}"
+            self.green_flag_text = self.wcfg["green_flag_text"]
 
         # Incoming traffic
-        if self.wcfg["show_traffic"]:
-            self.bar_traffic = self.set_rawtext(
+        if self.show_traffic:
+            self.bar_traffic = set_bar(
                 text="TRAFFIC",
-                width=bar_width,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.wcfg["font_color_traffic"],
                 bg_color=self.wcfg["bkg_color_traffic"],
             )
@@ -179,12 +187,9 @@ class Realtime(Overlay):
             )
 
         # Pit request
-        if self.wcfg["show_pit_request"]:
-            self.bar_pit_request = self.set_rawtext(
+        if self.show_pit_request:
+            self.bar_pit_request = set_bar(
                 text="PIT REQ",
-                width=bar_width,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.wcfg["font_color_pit_request"],
                 bg_color=self.wcfg["bkg_color_pit_request"],
             )
@@ -194,29 +199,27 @@ class Realtime(Overlay):
             )
 
         # Finish state
-        if self.wcfg["show_finish_state"]:
-            self.bar_style_finish_state = (
-                (
-                    self.wcfg["font_color_finish"],
-                    self.wcfg["bkg_color_finish"],
-                ),
-                (
-                    self.wcfg["font_color_disqualify"],
-                    self.wcfg["bkg_color_disqualify"],
-                ),
+        if self.show_finish_state:
+            # Foreground & background colors, 0 finish, 1 disqualify
+            self.fg_finish_state = (
+                self.wcfg["font_color_finish"],
+                self.wcfg["font_color_disqualify"],
+            )
+            self.bg_finish_state = (
+                self.wcfg["bkg_color_finish"],
+                self.wcfg["bkg_color_disqualify"],
             )
-            self.bar_finish_state = self.set_rawtext(
+            self.bar_finish_state = set_bar(
                 text="FINISH",
-                width=bar_width,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
-                fg_color=self.bar_style_finish_state[0][0],
-                bg_color=self.bar_style_finish_state[0][1],
+                fg_color=self.fg_finish_state[0],
+                bg_color=self.bg_finish_state[0],
             )
             self.set_primary_orient(
                 target=self.bar_finish_state,
                 column=self.wcfg["column_index_finish_state"],
             )
+            self.finish_text = self.wcfg["finish_text"]
+            self.disqualify_text = self.wcfg["disqualify_text"]
 
         # Last data
         self.pit_timer = PitTimer(self.wcfg["pit_time_highlight_duration"])
@@ -228,6 +231,25 @@ class Realtime(Overlay):
             self.wcfg["traffic_low_speed_threshold"],
         )
 
+        # Update steps of enabled items only, so disabled items cost nothing per update,
+        # store plain functions to avoid reference cycle from bound methods
+        self.update_steps = tuple(
+            step for enabled, step in (
+                (self.show_low_fuel or self.show_pit_request, Realtime.step_energy_limited),
+                (self.show_pit_timer, Realtime.step_pit_timer),
+                (self.show_low_fuel, Realtime.step_low_fuel),
+                (self.show_speed_limiter, Realtime.step_speed_limiter),
+                (self.show_blue_flag, Realtime.step_blue_flag),
+                (self.show_yellow_flag, Realtime.step_yellow_flag),
+                (self.show_startlights, Realtime.step_startlights),
+                (self.show_traffic, Realtime.step_traffic),
+                (self.show_pit_request, Realtime.step_pit_request),
+                (self.show_finish_state, Realtime.step_finish_state),
+            )
+            if enabled
+        )
+        self.energy_limited = False
+
     def post_update(self):
         self.pit_timer.reset()
         self.blue_timer.reset()
@@ -236,99 +258,117 @@ class Realtime(Overlay):
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
-        # Read state data
-        lap_etime = api.read.timing.elapsed()
-        in_pits = api.read.vehicle.in_pits()
-        in_race = api.read.session.in_race()
-
-        # Pit timer
-        if self.wcfg["show_pit_timer"]:
-            if in_pits and api.read.vehicle.in_garage():
-                pitting_state = MAX_SECONDS
-            else:
-                pitting_state = self.pit_timer.update(in_pits, lap_etime)
-            self.update_pit_timer(self.bar_pit_timer, pitting_state)
-
-        # Low fuel update
-        if self.wcfg["show_low_fuel"]:
-            fuel_usage = self.is_lowfuel(in_race)
-            self.update_lowfuel(self.bar_lowfuel, fuel_usage)
-
-        # Pit limiter
-        if self.wcfg["show_speed_limiter"]:
-            limiter_state = api.read.switch.speed_limiter()
-            self.update_limiter(self.bar_limiter, limiter_state)
+        # Read state data shared by all steps
+        read = api.read
+        lap_etime = read.timing.elapsed()
+        in_pits = read.vehicle.in_pits()
+        in_race = read.session.in_race()
+
+        for step in self.update_steps:
+            step(self, lap_etime, in_pits, in_race)
+
+    # Update steps, only enabled steps are called
+    def step_energy_limited(self, lap_etime, in_pits, in_race):
+        """Energy limited state, shared by low fuel & pit request"""
+        self.energy_limited = bool(
+            api.read.vehicle.max_virtual_energy()
+            and minfo.energy.estimatedLaps < minfo.fuel.estimatedLaps
+        )
 
-        # Blue flag
-        if self.wcfg["show_blue_flag"]:
-            blue_state = self.blue_timer.update(in_race, lap_etime)
-            self.update_blueflag(self.bar_blueflag, blue_state)
+    def step_pit_timer(self, lap_etime, in_pits, in_race):
+        """Pit timer"""
+        if in_pits and api.read.vehicle.in_garage():
+            pitting_state = MAX_SECONDS
+        else:
+            pitting_state = self.pit_timer.update(in_pits, lap_etime)
+        # Pit open state only affects an active pit timer (not finished)
+        pit_open = 0 <= pitting_state < MAX_SECONDS and api.read.session.pit_open()
+        self.update_pit_timer(self.bar_pit_timer, pitting_state, pit_open)
+
+    def step_low_fuel(self, lap_etime, in_pits, in_race):
+        """Low fuel update"""
+        fuel_usage = self.is_lowfuel(in_race)
+        self.update_lowfuel(self.bar_lowfuel, fuel_usage)
+
+    def step_speed_limiter(self, lap_etime, in_pits, in_race):
+        """Pit limiter"""
+        limiter_state = api.read.switch.speed_limiter()
+        self.update_limiter(self.bar_limiter, limiter_state)
+
+    def step_blue_flag(self, lap_etime, in_pits, in_race):
+        """Blue flag"""
+        blue_state = self.blue_timer.update(in_race, lap_etime)
+        self.update_blueflag(self.bar_blueflag, blue_state)
 
-        # Yellow flag
-        if self.wcfg["show_yellow_flag"]:
-            yellow_state = self.yellow_flag_state(in_race)
-            self.update_yellowflag(self.bar_yellowflag, yellow_state)
+    def step_yellow_flag(self, lap_etime, in_pits, in_race):
+        """Yellow flag"""
+        yellow_state = self.yellow_flag_state(in_race)
+        self.update_yellowflag(self.bar_yellowflag, yellow_state)
 
-        # Start lights
-        if self.wcfg["show_startlights"]:
-            green_state = self.green_timer.update(lap_etime)
-            self.update_startlights(self.bar_startlights, green_state)
+    def step_startlights(self, lap_etime, in_pits, in_race):
+        """Start lights"""
+        green_state = self.green_timer.update(lap_etime)
+        self.update_startlights(self.bar_startlights, green_state)
 
-        # Incoming traffic
-        if self.wcfg["show_traffic"]:
-            traffic = self.traffic_timer.update(in_pits, lap_etime)
-            self.update_traffic(self.bar_traffic, traffic)
+    def step_traffic(self, lap_etime, in_pits, in_race):
+        """Incoming traffic"""
+        traffic = self.traffic_timer.update(in_pits, lap_etime)
+        self.update_traffic(self.bar_traffic, traffic)
 
-        # Pit request
-        if self.wcfg["show_pit_request"]:
-            pit_request = self.pit_in_countdown()
-            self.update_pit_request(self.bar_pit_request, pit_request)
+    def step_pit_request(self, lap_etime, in_pits, in_race):
+        """Pit request"""
+        pit_request = self.pit_in_countdown()
+        self.update_pit_request(self.bar_pit_request, pit_request)
 
-        # Finish state
-        if self.wcfg["show_finish_state"]:
-            finish_state = api.read.vehicle.finish_state()
-            self.update_finish_state(self.bar_finish_state, finish_state)
+    def step_finish_state(self, lap_etime, in_pits, in_race):
+        """Finish state"""
+        finish_state = api.read.vehicle.finish_state()
+        self.update_finish_state(self.bar_finish_state, finish_state)
 
     # GUI update methods
-    def update_pit_timer(self, target, data):
+    def update_pit_timer(self, target, data, pit_open):
         """Pit timer"""
-        if target.last != data:
-            target.last = data
-            if data != MAX_SECONDS:
-                if data < 0:  # finished pits
-                    color_index = 1
+        # Compare at display resolution (0.01s), skip formatting until a digit changes
+        active = data != MAX_SECONDS
+        if active:
+            if data < 0:  # finished pits
+                color_index = 1
+            elif pit_open:
+                color_index = 0
+            else:  # pit closed, fixed text
+                color_index = 2
+            key = (color_index, round(data * 100) if color_index != 2 else 0)
+        else:
+            key = data
+        last = target.last
+        if last != key:
+            target.last = key
+            if active:
+                if color_index == 1:
                     state = f"F{-data: >6.2f}"[:7]
-                elif api.read.session.pit_open():
-                    color_index = 0
+                elif color_index == 0:
                     state = f"P{data: >6.2f}"[:7]
-                else:  # pit closed
-                    color_index = 2
-                    state = self.wcfg["pit_closed_text"]
-                target.text = state
-                target.fg, target.bg = self.bar_style_pit_timer[color_index]
-                target.update()
-                hidden = False
-            else:
-                hidden = True
+                else:
+                    state = self.pit_closed_text
+                target.apply(state, self.fg_pit_timer[color_index], self.bg_pit_timer[color_index])
 
-            if target.state != hidden:
-                target.state = hidden
-                target.setHidden(hidden)
+            # Toggle visibility only when crossing hidden state (MAX_SECONDS)
+            if (last == MAX_SECONDS) == active:
+                target.setHidden(not active)
 
     def update_lowfuel(self, target, data):
         """Low fuel warning"""
-        if target.last != data:
+        last = target.last
+        if last != data:
             target.last = data
-            if data != "":
+            active = data != ""
+            if active:
                 target.text = data
                 target.update()
-                hidden = False
-            else:
-                hidden = True
 
-            if target.state != hidden:
-                target.state = hidden
-                target.setHidden(hidden)
+            # Toggle visibility only when crossing hidden state (empty text)
+            if (last == "") == active:
+                target.setHidden(not active)
 
     def update_limiter(self, target, data):
         """Speed limiter"""
@@ -338,46 +378,47 @@ class Realtime(Overlay):
 
     def update_blueflag(self, target, data):
         """Blue flag"""
-        if target.last != data:
-            target.last = data
-            if data != MAX_SECONDS:
+        # Compare at display resolution (1s)
+        active = data != MAX_SECONDS
+        key = round(data) if active else data
+        last = target.last
+        if last != key:
+            target.last = key
+            if active:
                 target.text = f"BLUE{data:3.0f}"[:7]
                 target.update()
-                hidden = False
-            else:
-                hidden = True
 
-            if target.state != hidden:
-                target.state = hidden
-                target.setHidden(hidden)
+            # Toggle visibility only when crossing hidden state (MAX_SECONDS)
+            if (last == MAX_SECONDS) == active:
+                target.setHidden(not active)
 
     def update_yellowflag(self, target, data):
         """Yellow flag"""
-        if target.last != data:
-            target.last = data
-            if data != MAX_SECONDS:
-                text = f"{self.unit_dist(data):+.0f}{self.symbol_dist}"
-                target.text = f"Y{text: >6}"[:7]
+        # Compare at display resolution (1 distance unit)
+        active = data != MAX_SECONDS
+        key = round(self.unit_dist(data)) if active else data
+        last = target.last
+        if last != key:
+            target.last = key
+            if active:
+                target.text = self.yellow_text(key)
                 target.update()
-                hidden = False
-            else:
-                hidden = True
 
-            if target.state != hidden:
-                target.state = hidden
-                target.setHidden(hidden)
+            # Toggle visibility only when crossing hidden state (MAX_SECONDS)
+            if (last == MAX_SECONDS) == active:
+                target.setHidden(not active)
 
     def update_startlights(self, target, data):
         """Start lights"""
         if target.last != data:
             target.last = data
             if data > 0:
-                target.text = f"{self.wcfg['red_lights_text'][:6]: <6}{data}"
+                target.text = f"{self.red_lights_prefix}{data}"
                 target.bg = self.bar_style_startlights[0]
                 target.update()
                 hidden = False
             elif data == 0:
-                target.text = self.wcfg["green_flag_text"]
+                target.text = self.green_flag_text
                 target.bg = self.bar_style_startlights[1]
                 target.update()
                 hidden = False
@@ -390,47 +431,44 @@ class Realtime(Overlay):
 
     def update_traffic(self, target, data):
         """Incoming traffic"""
-        if target.last != data:
-            target.last = data
-            if data != MAX_SECONDS:
+        # Compare at display resolution (0.1s)
+        active = data != MAX_SECONDS
+        key = round(data * 10) if active else data
+        last = target.last
+        if last != key:
+            target.last = key
+            if active:
                 target.text = f"≥{data: >5.1f}s"[:7]
                 target.update()
-                hidden = False
-            else:
-                hidden = True
 
-            if target.state != hidden:
-                target.state = hidden
-                target.setHidden(hidden)
+            # Toggle visibility only when crossing hidden state (MAX_SECONDS)
+            if (last == MAX_SECONDS) == active:
+                target.setHidden(not active)
 
     def update_pit_request(self, target, data):
         """Pit request"""
-        if target.last != data:
+        last = target.last
+        if last != data:
             target.last = data
-            if data != "":
+            active = data != ""
+            if active:
                 target.text = data
                 target.update()
-                hidden = False
-            else:
-                hidden = True
 
-            if target.state != hidden:
-                target.state = hidden
-                target.setHidden(hidden)
+            # Toggle visibility only when crossing hidden state (empty text)
+            if (last == "") == active:
+                target.setHidden(not active)
 
     def update_finish_state(self, target, data):
         """Finish state"""
         if target.last != data:
             target.last = data
             if data == 1:
-                target.text = self.wcfg["finish_text"]
-                target.fg, target.bg = self.bar_style_finish_state[0]
-                target.update()
+                target.apply(self.finish_text, self.fg_finish_state[0], self.bg_finish_state[0])
                 hidden = False
             elif data == 3:
-                target.text = self.wcfg["disqualify_text"]
-                target.fg, target.bg = self.bar_style_finish_state[1]
-                target.update()
+                target.apply(
+                    self.disqualify_text, self.fg_finish_state[1], self.bg_finish_state[1])
                 hidden = False
             else:
                 hidden = True
@@ -442,10 +480,10 @@ class Realtime(Overlay):
     # Additional methods
     def is_lowfuel(self, in_race):
         """Is low fuel"""
-        if self.wcfg["show_low_fuel_for_race_only"] and not in_race:
+        if self.lowfuel_race_only and not in_race:
             return ""
 
-        if api.read.vehicle.max_virtual_energy() and minfo.energy.estimatedLaps < minfo.fuel.estimatedLaps:
+        if self.energy_limited:
             prefix = "LE"
             amount_curr = minfo.energy.amountCurrent
             est_laps = minfo.energy.estimatedLaps
@@ -454,42 +492,68 @@ class Realtime(Overlay):
             amount_curr = minfo.fuel.amountCurrent
             est_laps = minfo.fuel.estimatedLaps
 
-        if (amount_curr > self.wcfg["low_fuel_volume_threshold"] or
-            est_laps > self.wcfg["low_fuel_lap_threshold"]):
+        if (amount_curr > self.lowfuel_volume_threshold or
+            est_laps > self.lowfuel_lap_threshold):
             return ""  # not low fuel
 
         if prefix == "LF":
             amount_curr = self.unit_fuel(amount_curr)
-        return f"{prefix}{amount_curr: >5.2f}"[:7]
+        # Reuse last text while displayed value (2 decimal places) unchanged
+        key = (prefix, round(amount_curr * 100))
+        if self.last_lowfuel_key != key:
+            self.last_lowfuel_key = key
+            self.last_lowfuel_text = f"{prefix}{amount_curr: >5.2f}"[:7]
+        return self.last_lowfuel_text
 
     def pit_in_countdown(self) -> str:
         """Pit in countdown (laps)"""
         if not api.read.vehicle.pit_request():
             return ""
 
-        if api.read.vehicle.max_virtual_energy():
-            est_laps = min(minfo.fuel.estimatedLaps, minfo.energy.estimatedLaps)
+        if self.energy_limited:
+            est_laps = minfo.energy.estimatedLaps
         else:
             est_laps = minfo.fuel.estimatedLaps
         cd_laps = calc.pit_in_countdown_laps(est_laps, api.read.lap.progress())
 
-        safe_laps = f"{cd_laps:.2f}"[:3].strip(".")
-        est_laps = f"{est_laps:.2f}"[:3].strip(".")
+        safe_laps = laps_text(round(cd_laps * 100))
+        est_laps = laps_text(round(est_laps * 100))
         return f"{safe_laps: <3}≤{est_laps: >3}"
 
     def yellow_flag_state(self, in_race: bool) -> float:
         """Yellow flag state"""
-        if not self.wcfg["show_yellow_flag_for_race_only"] or in_race:
-            if api.read.session.yellow_flag():
-                yellow_ahead = minfo.vehicles.nearestYellowAhead
-                if yellow_ahead <= self.wcfg["yellow_flag_maximum_range_ahead"]:
-                    return yellow_ahead
-                yellow_behind = minfo.vehicles.nearestYellowBehind
-                if yellow_behind >= -self.wcfg["yellow_flag_maximum_range_behind"]:
-                    return yellow_behind
+        if self.yellow_race_only and not in_race:
+            return MAX_SECONDS
+        if not api.read.session.yellow_flag():
+            return MAX_SECONDS
+        vehicles = minfo.vehicles
+        yellow_ahead = vehicles.nearestYellowAhead
+        if yellow_ahead <= self.yellow_range_ahead:
+            return yellow_ahead
+        yellow_behind = vehicles.nearestYellowBehind
+        if yellow_behind >= self.yellow_range_behind:
+            return yellow_behind
         return MAX_SECONDS
 
 
+@lru_cache(maxsize=256)
+def laps_text(hundredths: int) -> str:
+    """Laps text (max 3 chars) from integer hundredths of lap, cached
+
+    Laps change slowly while pit request is active, so most calls are served from cache.
+    """
+    return f"{hundredths / 100:.2f}"[:3].strip(".")
+
+
+def set_yellow_text(symbol: str) -> Callable[[int], str]:
+    """Set yellow flag text formatter, from rounded distance in display unit"""
+
+    def yellow_text(distance: int) -> str:
+        return f"Y{f'{distance:+d}{symbol}': >6}"[:7]
+
+    return yellow_text
+
+
 class GreenFlagTimer:
     """Green flag timer"""
 
@@ -530,6 +594,7 @@ class TrafficTimer:
         "_max_time_gap",
         "_pitout_duration",
         "_low_speed_threshold",
+        "_low_speed_enabled",
     )
 
     def __init__(self, max_time_gap: bool, pitout_duration: float, low_speed_threshold: float):
@@ -538,6 +603,7 @@ class TrafficTimer:
         self._max_time_gap = max_time_gap
         self._pitout_duration = pitout_duration
         self._low_speed_threshold = low_speed_threshold
+        self._low_speed_enabled = low_speed_threshold > 0
 
     def update(self, in_pits: bool, elapsed_time: float) -> float:
         """Check incoming traffic and time gap"""
@@ -550,8 +616,9 @@ class TrafficTimer:
 
         traffic_time = minfo.vehicles.nearestTraffic
         if traffic_time < self._max_time_gap:
-            if (api.read.vehicle.speed() < self._low_speed_threshold > 0
-                or in_pits or self._timer_start):
+            # Check cheap states first, only read speed if low speed check enabled
+            if (in_pits or self._timer_start or (self._low_speed_enabled
+                and api.read.vehicle.speed() < self._low_speed_threshold)):
                 return traffic_time
         return MAX_SECONDS
 
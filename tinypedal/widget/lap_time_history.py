@@ -20,6 +20,8 @@
 Lap time history Widget
 """
 
+from operator import attrgetter
+
 from .. import calculation as calc
 from .. import units
 from ..api_control import api
@@ -51,11 +53,20 @@ class Realtime(Overlay):
         bar_padx = self.set_padding(self.wcfg["font_size"], self.wcfg["bar_padding"])
         self.history_slot = min(max(self.wcfg["lap_time_history_count"], 1), 100)
 
+        # Config enabled state, read once instead of per update
+        self.show_laps = self.wcfg["show_laps"]
+        self.show_time = self.wcfg["show_time"]
+        self.show_delta = self.wcfg["show_delta"]
+        self.show_fuel = self.wcfg["show_fuel"]
+        self.show_wear = self.wcfg["show_wear"]
+        self.show_empty_history = self.wcfg["show_empty_history"]
+        self.show_virtual_energy = self.wcfg["show_virtual_energy_if_available"]
+
         # Config units
         self.unit_fuel = units.set_unit_fuel(self.cfg.units["fuel_unit"])
 
         # Laps
-        if self.wcfg["show_laps"]:
+        if self.show_laps:
             self.bars_laps = self.set_rawtext(
                 text="---",
                 width=font_m.width * 3 + bar_padx,
@@ -75,32 +86,29 @@ class Realtime(Overlay):
             )
 
         # Time
-        if self.wcfg["show_time"]:
-            self.bar_style_time = (
-                (
-                    self.wcfg["font_color_time"],
-                    self.wcfg["bkg_color_time"],
-                ),
-                (
-                    self.wcfg["font_color_last_time"],
-                    self.wcfg["bkg_color_last_time"],
-                ),
-                (
-                    self.wcfg["font_color_invalid_laptime"],
-                    self.wcfg["bkg_color_last_time"],
-                ),
+        if self.show_time:
+            # Foreground & background colors, 0 current, 1 last valid, 2 last invalid
+            self.fg_time = (
+                self.wcfg["font_color_time"],
+                self.wcfg["font_color_last_time"],
+                self.wcfg["font_color_invalid_laptime"],
+            )
+            self.bg_time = (
+                self.wcfg["bkg_color_time"],
+                self.wcfg["bkg_color_last_time"],
+                self.wcfg["bkg_color_last_time"],
             )
             self.bars_time = self.set_rawtext(
                 text=TEXT_NOLAPTIME,
                 width=font_m.width * 8 + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
-                fg_color=self.bar_style_time[1][0],
-                bg_color=self.bar_style_time[1][1],
+                fg_color=self.fg_time[1],
+                bg_color=self.bg_time[1],
                 count=self.history_slot + 1,
             )
-            self.bars_time[0].fg = self.bar_style_time[0][0]
-            self.bars_time[0].bg = self.bar_style_time[0][1]
+            self.bars_time[0].fg = self.fg_time[0]
+            self.bars_time[0].bg = self.bg_time[0]
             self.set_grid_layout_table_column(
                 layout=layout,
                 targets=self.bars_time,
@@ -109,7 +117,7 @@ class Realtime(Overlay):
             )
 
         # Lap time delta
-        if self.wcfg["show_delta"]:
+        if self.show_delta:
             self.bar_style_delta = (
                 (
                     self.wcfg["font_color_delta"],
@@ -139,7 +147,7 @@ class Realtime(Overlay):
             )
 
         # Fuel
-        if self.wcfg["show_fuel"]:
+        if self.show_fuel:
             self.bars_fuel = self.set_rawtext(
                 text="-.--",
                 width=font_m.width * 4 + bar_padx,
@@ -159,7 +167,7 @@ class Realtime(Overlay):
             )
 
         # Tyre wear
-        if self.wcfg["show_wear"]:
+        if self.show_wear:
             self.bars_wear = self.set_rawtext(
                 text="---",
                 width=font_m.width * 3 + bar_padx,
@@ -182,28 +190,31 @@ class Realtime(Overlay):
         self.empty_data = ConsumptionDataSet()
         self.last_data_version = -1
         self.last_max_energy = 0.0
+        self.last_history_keys = [None] * self.history_slot
+        self.last_history_hidden = [None] * self.history_slot
         self.update_laps_history(())
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
         max_energy = api.read.vehicle.max_virtual_energy()
-        # Check if virtual energy available
-        if self.wcfg["show_virtual_energy_if_available"] and max_energy:
-            temp_fuel_est = minfo.energy.estimatedConsumption
-        else:
-            temp_fuel_est = self.unit_fuel(minfo.fuel.estimatedConsumption)
 
         # Current laps data
-        if self.wcfg["show_laps"]:
+        if self.show_laps:
             self.update_laps(self.bars_laps[0], api.read.lap.number())
-        if self.wcfg["show_time"]:
+        if self.show_time:
             self.update_time(self.bars_time[0], minfo.delta.lapTimeEstimated)
-        if self.wcfg["show_delta"]:
+        if self.show_delta:
             self.update_delta(self.bars_delta[0], minfo.delta.deltaLast)
-        if self.wcfg["show_fuel"]:
+        if self.show_fuel:
+            # Check if virtual energy available
+            if self.show_virtual_energy and max_energy:
+                temp_fuel_est = minfo.energy.estimatedConsumption
+            else:
+                temp_fuel_est = self.unit_fuel(minfo.fuel.estimatedConsumption)
             self.update_fuel(self.bars_fuel[0], temp_fuel_est)
-        if self.wcfg["show_wear"]:
-            self.update_wear(self.bars_wear[0], calc.mean(minfo.wheels.estimatedTreadWear))
+        if self.show_wear:
+            wear_fl, wear_fr, wear_rl, wear_rr = minfo.wheels.estimatedTreadWear
+            self.update_wear(self.bars_wear[0], (wear_fl + wear_fr + wear_rl + wear_rr) * 0.25)
 
         # History laps data
         if (
@@ -212,7 +223,12 @@ class Realtime(Overlay):
         ):
             self.last_data_version = minfo.history.consumptionDataVersion
             self.last_max_energy = max_energy
-            self.update_laps_history(minfo.history.consumptionDataSet)
+            # Batch row changes, repaint once after refresh
+            self.setUpdatesEnabled(False)
+            try:
+                self.update_laps_history(minfo.history.consumptionDataSet)
+            finally:
+                self.setUpdatesEnabled(True)
 
     # GUI update methods
     def update_laps(self, target, data):
@@ -252,36 +268,57 @@ class Realtime(Overlay):
 
     def update_laps_history(self, dataset):
         """Laps history data"""
-        is_energy = bool(self.wcfg["show_virtual_energy_if_available"] and api.read.vehicle.max_virtual_energy())
+        is_energy = bool(self.show_virtual_energy and api.read.vehicle.max_virtual_energy())
+        # Select fuel or energy field once per refresh
+        lap_used = attrgetter("lastLapUsedEnergy" if is_energy else "lastLapUsedFuel")
+        empty_data = self.empty_data
+        hidden_empty = not self.show_empty_history
+        last_history_keys = self.last_history_keys
+        last_history_hidden = self.last_history_hidden
+        total_laps = len(dataset)
         for index in range(self.history_slot):
-            if index < len(dataset):
+            if index < total_laps:
                 data = dataset[index]
                 hidden = False
             else:
-                data = self.empty_data
-                hidden = not self.wcfg["show_empty_history"]
+                data = empty_data
+                hidden = hidden_empty
+            # Skip row if same lap data, previous lap time (for delta) & display state
+            last_data = dataset[index + 1] if index + 1 < total_laps else empty_data
+            key = (data, last_data.lapTimeLast, hidden, is_energy)
+            if last_history_keys[index] == key:
+                continue
+            last_history_keys[index] = key
+            # Only toggle visibility if row hidden state changed
+            toggle_hidden = last_history_hidden[index] != hidden
+            last_history_hidden[index] = hidden
             index += 1
 
-            if self.wcfg["show_laps"]:
+            if self.show_laps:
                 self.update_laps(self.bars_laps[index], data.lapNumber)
-                self.bars_laps[index].setHidden(hidden)
+                if toggle_hidden:
+                    self.bars_laps[index].setHidden(hidden)
 
-            if self.wcfg["show_time"]:
+            if self.show_time:
                 invalid = (2 - data.isValidLap) if (data.lapTimeLast > 0) else 1
-                self.bars_time[index].fg = self.bar_style_time[invalid][0]
-                self.bars_time[index].bg = self.bar_style_time[invalid][1]
-                self.update_time(self.bars_time[index], data.lapTimeLast)
-                self.bars_time[index].setHidden(hidden)
+                bar_time = self.bars_time[index]
+                bar_time.fg = self.fg_time[invalid]
+                bar_time.bg = self.bg_time[invalid]
+                self.update_time(bar_time, data.lapTimeLast)
+                if toggle_hidden:
+                    bar_time.setHidden(hidden)
 
-            if self.wcfg["show_delta"]:
-                last_data = dataset[index] if index < len(dataset) else self.empty_data
+            if self.show_delta:
                 self.update_delta(self.bars_delta[index], data.lapTimeLast - last_data.lapTimeLast)
-                self.bars_delta[index].setHidden(hidden)
+                if toggle_hidden:
+                    self.bars_delta[index].setHidden(hidden)
 
-            if self.wcfg["show_fuel"]:
-                self.update_fuel(self.bars_fuel[index], data.lastLapUsedEnergy if is_energy else data.lastLapUsedFuel)
-                self.bars_fuel[index].setHidden(hidden)
+            if self.show_fuel:
+                self.update_fuel(self.bars_fuel[index], lap_used(data))
+                if toggle_hidden:
+                    self.bars_fuel[index].setHidden(hidden)
 
-            if self.wcfg["show_wear"]:
+            if self.show_wear:
                 self.update_wear(self.bars_wear[index], data.tyreAvgWearLast)
-                self.bars_wear[index].setHidden(hidden)
+                if toggle_hidden:
+                    self.bars_wear[index].setHidden(hidden)
@@ -57,11 +57,22 @@ class Realtime(Overlay):
         bar_padx = self.set_padding(self.wcfg["font_size"], self.wcfg["bar_padding"])
         stint_slot = max(self.wcfg["stint_history_count"], 1)
 
+        # Config enabled state, read once instead of per update
+        self.show_laps = self.wcfg["show_laps"]
+        self.show_time = self.wcfg["show_time"]
+        self.show_fuel = self.wcfg["show_fuel"]
+        self.show_tyre = self.wcfg["show_tyre"]
+        self.show_wear = self.wcfg["show_wear"]
+        self.show_delta = self.wcfg["show_delta"]
+        self.show_consistency = self.wcfg["show_consistency"]
+        self.show_empty_history = self.wcfg["show_empty_history"]
+        self.show_virtual_energy = self.wcfg["show_virtual_energy_if_available"]
+
         # Config units
         self.unit_fuel = units.set_unit_fuel(self.cfg.units["fuel_unit"])
 
         # Laps
-        if self.wcfg["show_laps"]:
+        if self.show_laps:
             self.bars_laps = self.set_rawtext(
                 text="---",
                 width=font_m.width * 3 + bar_padx,
@@ -81,7 +92,7 @@ class Realtime(Overlay):
             )
 
         # Time
-        if self.wcfg["show_time"]:
+        if self.show_time:
             self.bars_time = self.set_rawtext(
                 text="--:--",
                 width=font_m.width * 5 + bar_padx,
@@ -101,7 +112,7 @@ class Realtime(Overlay):
             )
 
         # Fuel
-        if self.wcfg["show_fuel"]:
+        if self.show_fuel:
             self.bars_fuel = self.set_rawtext(
                 text="-.---",
                 width=font_m.width * 5 + bar_padx,
@@ -121,7 +132,7 @@ class Realtime(Overlay):
             )
 
         # Tyre compound
-        if self.wcfg["show_tyre"]:
+        if self.show_tyre:
             self.bars_cmpd = self.set_rawtext(
                 text="--",
                 width=font_m.width * 2 + bar_padx,
@@ -141,7 +152,7 @@ class Realtime(Overlay):
             )
 
         # Tyre wear
-        if self.wcfg["show_wear"]:
+        if self.show_wear:
             self.bars_wear = self.set_rawtext(
                 text="---",
                 width=font_m.width * 3 + bar_padx,
@@ -161,7 +172,7 @@ class Realtime(Overlay):
             )
 
         # Stint delta
-        if self.wcfg["show_delta"]:
+        if self.show_delta:
             self.bars_delta = self.set_rawtext(
                 text="--.--",
                 width=font_m.width * 5 + bar_padx,
@@ -181,7 +192,7 @@ class Realtime(Overlay):
             )
 
         # Stint consistency
-        if self.wcfg["show_consistency"]:
+        if self.show_consistency:
             self.bars_consist = self.set_rawtext(
                 text="--.---",
                 width=font_m.width * 6 + bar_padx,
@@ -206,6 +217,7 @@ class Realtime(Overlay):
         self.stint_data = [0, 0.0, 0.0, 0.0, "--", 0.0, 0.0, 0.0]
         self.empty_data = tuple(self.stint_data)
         self.history_data = deque([self.empty_data for _ in range(stint_slot)], stint_slot)
+        self.last_history_hidden = [None] * stint_slot
         self.stint_stats = stint_history_stats(
             self.stint_data,
             self.history_data,
@@ -213,34 +225,48 @@ class Realtime(Overlay):
             max(self.wcfg["minimum_pitstop_threshold_seconds"], 0.0),
             max(self.wcfg["minimum_tyre_temperature_threshold"], 0.0),
         )
+
+        # Enabled columns, except fuel (unit depends on energy state):
+        # 0 stint data index, 1 update function, 2 bars,
+        # store plain functions to avoid reference cycle from bound methods
+        data_columns = []
+        if self.show_laps:
+            data_columns.append((0, Realtime.update_laps, self.bars_laps))
+        if self.show_time:
+            data_columns.append((1, Realtime.update_time, self.bars_time))
+        if self.show_tyre:
+            data_columns.append((4, Realtime.update_cmpd, self.bars_cmpd))
+        if self.show_wear:
+            data_columns.append((5, Realtime.update_wear, self.bars_wear))
+        if self.show_delta:
+            data_columns.append((6, Realtime.update_delta, self.bars_delta))
+        if self.show_consistency:
+            data_columns.append((7, Realtime.update_consist, self.bars_consist))
+        self.data_columns = tuple(data_columns)
         self.update_stint_history(False)
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
-        show_energy = self.wcfg["show_virtual_energy_if_available"] and api.read.vehicle.max_virtual_energy()
+        show_energy = self.show_virtual_energy and api.read.vehicle.max_virtual_energy()
 
         if next(self.stint_stats):
-            self.update_stint_history(show_energy)
+            # Batch row changes, repaint once after refresh
+            self.setUpdatesEnabled(False)
+            try:
+                self.update_stint_history(show_energy)
+            finally:
+                self.setUpdatesEnabled(True)
 
         # Current stint data
-        if self.wcfg["show_laps"]:
-            self.update_laps(self.bars_laps[0], self.stint_data[0])
-        if self.wcfg["show_time"]:
-            self.update_time(self.bars_time[0], self.stint_data[1])
-        if self.wcfg["show_fuel"]:
+        stint_data = self.stint_data
+        for data_index, update, bars in self.data_columns:
+            update(self, bars[0], stint_data[data_index])
+        if self.show_fuel:
             if show_energy:
-                fuel = self.stint_data[3]
+                fuel = stint_data[3]
             else:
-                fuel = self.unit_fuel(self.stint_data[2])
+                fuel = self.unit_fuel(stint_data[2])
             self.update_fuel(self.bars_fuel[0], fuel)
-        if self.wcfg["show_tyre"]:
-            self.update_cmpd(self.bars_cmpd[0], self.stint_data[4])
-        if self.wcfg["show_wear"]:
-            self.update_wear(self.bars_wear[0], self.stint_data[5])
-        if self.wcfg["show_delta"]:
-            self.update_delta(self.bars_delta[0], self.stint_data[6])
-        if self.wcfg["show_consistency"]:
-            self.update_consist(self.bars_consist[0], self.stint_data[7])
 
     # GUI update methods
     def update_cmpd(self, target, data):
@@ -259,9 +285,11 @@ class Realtime(Overlay):
 
     def update_time(self, target, data):
         """Time data"""
-        if target.last != data:
-            target.last = data
-            target.text = calc.sec2stinttime(data)[:5]
+        # Compare at display resolution (whole seconds)
+        seconds = int(data)
+        if target.last != seconds:
+            target.last = seconds
+            target.text = calc.sec2stinttime(seconds)[:5]
             target.update()
 
     def update_fuel(self, target, data):
@@ -294,44 +322,31 @@ class Realtime(Overlay):
 
     def update_stint_history(self, show_energy: bool):
         """Stint history data"""
+        data_columns = self.data_columns
+        last_history_hidden = self.last_history_hidden
         for index, data in enumerate(self.history_data, 1):
             if data[1]:
                 hidden = False
             else:
                 data = self.empty_data
-                hidden = not self.wcfg["show_empty_history"]
-
-            if self.wcfg["show_laps"]:
-                self.update_laps(self.bars_laps[index], data[0])
-                self.bars_laps[index].setHidden(hidden)
+                hidden = not self.show_empty_history
+            # Only toggle visibility if row hidden state changed
+            toggle_hidden = last_history_hidden[index - 1] != hidden
+            last_history_hidden[index - 1] = hidden
 
-            if self.wcfg["show_time"]:
-                self.update_time(self.bars_time[index], data[1])
-                self.bars_time[index].setHidden(hidden)
+            for data_index, update, bars in data_columns:
+                update(self, bars[index], data[data_index])
+                if toggle_hidden:
+                    bars[index].setHidden(hidden)
 
-            if self.wcfg["show_fuel"]:
+            if self.show_fuel:
                 if show_energy:
                     fuel = data[3]
                 else:
                     fuel = self.unit_fuel(data[2])
                 self.update_fuel(self.bars_fuel[index], fuel)
-                self.bars_fuel[index].setHidden(hidden)
-
-            if self.wcfg["show_tyre"]:
-                self.update_cmpd(self.bars_cmpd[index], data[4])
-                self.bars_cmpd[index].setHidden(hidden)
-
-            if self.wcfg["show_wear"]:
-                self.update_wear(self.bars_wear[index], data[5])
-                self.bars_wear[index].setHidden(hidden)
-
-            if self.wcfg["show_delta"]:
-                self.update_delta(self.bars_delta[index], data[6])
-                self.bars_delta[index].setHidden(hidden)
-
-            if self.wcfg["show_consistency"]:
-                self.update_consist(self.bars_consist[index], data[7])
-                self.bars_consist[index].setHidden(hidden)
+                if toggle_hidden:
+                    self.bars_fuel[index].setHidden(hidden)
 
 
 @generator_init
@@ -358,6 +373,7 @@ def stint_history_stats(
     last_fuel_curr = 0
     last_energy_curr = 0
     last_time_stop = 0
+    last_compound = None
 
     # Stint consistency
     pitting = 1
@@ -370,20 +386,23 @@ def stint_history_stats(
 
     while True:
         yield False
-        # Read stint data
-        lap_stime = api.read.timing.start()
-        lap_number = api.read.lap.number()
-        elapsed_time = api.read.session.elapsed()
-        in_pits = api.read.vehicle.in_pits()
-        in_garage = api.read.vehicle.in_garage()
-        wear_avg = 100 - sum(api.read.tyre.wear()) * 25
+        # Read stint data, bind reader once per update (may change on api restart)
+        read = api.read
+        read_vehicle = read.vehicle
+        lap_stime = read.timing.start()
+        lap_number = read.lap.number()
+        elapsed_time = read.session.elapsed()
+        in_pits = read_vehicle.in_pits()
+        in_garage = read_vehicle.in_garage()
+        wear_fl, wear_fr, wear_rl, wear_rr = read.tyre.wear()
+        wear_avg = 100 - (wear_fl + wear_fr + wear_rl + wear_rr) * 25
         fuel_curr = minfo.fuel.amountCurrent
         energy_curr = minfo.energy.amountCurrent
 
         # Ignore stint
         if (
             in_garage  # ignore while in garage
-            or api.read.session.pre_race()  # ignore before race starts
+            or read.session.pre_race()  # ignore before race starts
             or abs(last_time - elapsed_time) > 4  # ignore game pause
         ):
             reset_stint = True
@@ -396,7 +415,7 @@ def stint_history_stats(
             last_wear_avg = wear_avg
             stint_running = True
         elif stint_running:
-            if api.read.vehicle.speed() > 1:
+            if read_vehicle.speed() > 1:
                 last_time_stop = elapsed_time
             if (last_wear_avg > wear_avg
                 or last_fuel_curr < fuel_curr
@@ -425,12 +444,15 @@ def stint_history_stats(
             stint_fastest = MAX_SECONDS
             consistency = 1.0
             delta = 0.0
-            # Update compound info once per stint
-            class_name = api.read.vehicle.class_name()
-            stint_data[4] = "".join(
-                select_compound_symbol(f"{class_name} - {tcmpd_name}")
-                for tcmpd_name in api.read.tyre.compound_name()
-            )
+            # Update compound info once per stint, skip if same class & compound
+            compound = (read_vehicle.class_name(), read.tyre.compound_name())
+            if last_compound != compound:
+                last_compound = compound
+                class_name = compound[0]
+                stint_data[4] = "".join(
+                    select_compound_symbol(f"{class_name} - {tcmpd_name}")
+                    for tcmpd_name in compound[1]
+                )
 
         if start_fuel < fuel_curr:
             start_fuel = fuel_curr
@@ -445,7 +467,7 @@ def stint_history_stats(
             if (
                 not pitting
                 and last_laptime > 0
-                and max(api.read.tyre.carcass_temperature()) > minimum_tyre_temperature
+                and max(read.tyre.carcass_temperature()) > minimum_tyre_temperature
             ):
                 stint_laps += 1
                 stint_time += last_laptime